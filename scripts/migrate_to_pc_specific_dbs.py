@@ -88,6 +88,18 @@ def migrate_data():
                         records
                     )
 
+                    # Older databases have no message_type_code column;
+                    # fill it in for the copied rows (0=user, 1=assistant, 2=other)
+                    new_cursor.execute("""
+                        UPDATE usage_records
+                        SET message_type_code = CASE message_type
+                            WHEN 'user' THEN 0
+                            WHEN 'assistant' THEN 1
+                            ELSE 2
+                        END
+                        WHERE message_type_code IS NULL
+                    """)
+
                     # Copy daily_snapshots (aggregate all machines' data)
                     cursor.execute("SELECT * FROM daily_snapshots")
                     snapshots = cursor.fetchall()
@@ -130,6 +142,22 @@ def migrate_data():
                             pricing
                         )
 
+                    # Older databases have no cost column; price the copied
+                    # rows so device stats (which sum the stored cost) count them
+                    new_cursor.execute("""
+                        UPDATE usage_records
+                        SET cost = (
+                            SELECT
+                                (usage_records.input_tokens / 1000000.0) * input_price_per_mtok +
+                                (usage_records.output_tokens / 1000000.0) * output_price_per_mtok +
+                                (usage_records.cache_creation_tokens / 1000000.0) * cache_write_price_per_mtok +
+                                (usage_records.cache_read_tokens / 1000000.0) * cache_read_price_per_mtok
+                            FROM model_pricing
+                            WHERE model_name = usage_records.model
+                        )
+                        WHERE cost IS NULL AND model IS NOT NULL
+                    """)
+
                     # Copy user_preferences (shared across all DBs)
                     try:
                         cursor.execute("SELECT * FROM user_preferences")
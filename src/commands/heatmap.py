@@ -1,5 +1,7 @@
 #region Imports
-from datetime import datetime, timedelta
+from datetime import date, datetime
+from functools import lru_cache
+from math import sqrt
 from typing import Optional
 
 from rich.console import Console
@@ -116,29 +118,35 @@ def _display_heatmap(console: Console, stats, limits_data: dict, year: Optional[
     for _ in range(jan1_day):
         current_week.append((None, None))
 
-    # Add all days
-    current_date = start_date
-    while current_date <= end_date:
-        date_key = current_date.strftime("%Y-%m-%d")
-        day_stats = stats.daily_stats.get(date_key)
+    # Add all days (isoformat() is the same YYYY-MM-DD key as strftime,
+    # without the strftime call per day)
+    daily_stats = stats.daily_stats
+    for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+        current_date = date.fromordinal(ordinal)
+        day_stats = daily_stats.get(current_date.isoformat())
         current_week.append((day_stats, current_date))
 
         if len(current_week) == 7:
             weeks.append(current_week)
             current_week = []
 
-        current_date += timedelta(days=1)
-
     # Pad final week
     if current_week:
         while len(current_week) < 7:
             current_week.append((None, None))
         weeks.append(current_week)
 
-    # Calculate max tokens for color scaling
-    max_tokens = max(
-        (s.total_tokens for s in stats.daily_stats.values()), default=1
-    ) if stats.daily_stats else 1
+    # Max tokens for color scaling, plus the summary totals, in one pass
+    max_tokens = 1 if not daily_stats else 0
+    total_tokens = 0
+    total_days = 0
+    for s in daily_stats.values():
+        day_tokens = s.total_tokens
+        if day_tokens > max_tokens:
+            max_tokens = day_tokens
+        if day_tokens > 0:
+            total_tokens += day_tokens
+            total_days += 1
 
     # Clear screen and display
     console.clear()
@@ -191,11 +199,11 @@ def _display_heatmap(console: Console, stats, limits_data: dict, year: Optional[
 
                 if date is None:
                     # Empty cell for padding
-                    row_cells.append(Text("  ", style=""))
+                    row_cells.append(_heatmap_cell(""))
                 else:
                     # Get color and create colored cell (2 spaces for square shape)
                     color_style = color_func(day_stats, date)
-                    row_cells.append(Text("  ", style=f"on {color_style}"))
+                    row_cells.append(_heatmap_cell(f"on {color_style}"))
 
             table.add_row(*row_cells)
 
@@ -234,7 +242,7 @@ def _display_heatmap(console: Console, stats, limits_data: dict, year: Optional[
 
     # 2. Week Limit % heatmap (blue → red gradient)
     def week_color_func(day_stats, date):
-        date_key = date.strftime("%Y-%m-%d")
+        date_key = date.isoformat()
         week_pct = limits_data.get(date_key, {}).get("week_pct", None)  # None for no data
         return _get_limits_style(week_pct, (93, 150, 203), date, today)
 
@@ -249,7 +257,7 @@ def _display_heatmap(console: Console, stats, limits_data: dict, year: Optional[
 
     # 3. Opus Limit % heatmap (green → red gradient)
     def opus_color_func(day_stats, date):
-        date_key = date.strftime("%Y-%m-%d")
+        date_key = date.isoformat()
         opus_pct = limits_data.get(date_key, {}).get("opus_pct", None)  # None for no data
         return _get_limits_style(opus_pct, (93, 203, 123), date, today)
 
@@ -271,8 +279,6 @@ def _display_heatmap(console: Console, stats, limits_data: dict, year: Optional[
     console.print()
 
     # Summary stats
-    total_days = sum(1 for s in stats.daily_stats.values() if s.total_tokens > 0)
-    total_tokens = sum(s.total_tokens for s in stats.daily_stats.values())
     console.print(f"[dim]Total: {total_tokens:,} tokens across {total_days} active days[/dim]")
     console.print()
     console.print("[dim]Tip: Use [bold]ccu export --open[/bold] for high-resolution PNG[/dim]")
@@ -318,6 +324,23 @@ def _load_limits_data() -> dict:
     return limits_data
 
 
+@lru_cache(maxsize=512)
+def _heatmap_cell(style: str) -> Text:
+    """
+    Get the two-space heatmap cell for a style.
+
+    Cells are only read when the table renders, so one Text per distinct
+    style is shared by every cell with that color.
+
+    Args:
+        style: Rich style string (e.g. "on #3C3C3A", or "" for padding)
+
+    Returns:
+        Text cell
+    """
+    return Text("  ", style=style)
+
+
 def _get_tokens_style(day_stats, max_tokens: int, date, today) -> str:
     """
     Get Rich color style for token usage (same as PNG export).
@@ -343,7 +366,7 @@ def _get_tokens_style(day_stats, max_tokens: int, date, today) -> str:
     ratio = day_stats.total_tokens / max_tokens if max_tokens > 0 else 0
 
     # Apply non-linear scaling (same as PNG export)
-    ratio = ratio ** 0.5
+    ratio = sqrt(ratio)
 
     # Interpolate from dark grey (#3C3C3A) to orange (#CB7B5D)
     dark_grey = (60, 60, 58)
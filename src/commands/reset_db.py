@@ -6,6 +6,7 @@ from rich.console import Console
 
 from src.storage.snapshot_db import (
     DEFAULT_DB_PATH,
+    close_cached_connections,
     get_database_stats,
 )
 #endregion
@@ -66,6 +67,7 @@ def run(console: Console) -> None:
                 pass  # DB might be corrupted, skip stats
 
             # Delete main database
+            close_cached_connections(optimize=False)
             db_path.unlink()
             deleted_files.append(str(db_path))
             console.print(f"[green]✓ Deleted database: {db_path.name}[/green]")
@@ -38,7 +38,7 @@ def run(console: Console) -> None:
             _display_settings_menu(console, prefs, machine_name, db_path)
 
             # Wait for user input
-            console.print("\n[dim]Enter setting key to edit ([#ff8800]1-5, 8-9, a-i[/#ff8800]), [#ff8800]\\[x][/#ff8800] reset to defaults, or [#ff8800]ESC[/#ff8800] to return...[/dim]", end="")
+            console.print("\n[dim]Enter setting key to edit ([#ff8800]1-5, 8-9, a-l[/#ff8800]), [#ff8800]\\[x][/#ff8800] reset to defaults, or [#ff8800]ESC[/#ff8800] to return...[/dim]", end="")
 
             key = _read_key()
 
@@ -65,6 +65,15 @@ def run(console: Console) -> None:
             elif key.lower() == 'c':  # Backup Retention
                 setting_num = 12
                 _edit_setting(console, setting_num, prefs, save_user_preference)
+            elif key.lower() == 'j':  # Weekly Backups
+                setting_num = 16
+                _edit_setting(console, setting_num, prefs, save_user_preference)
+            elif key.lower() == 'k':  # Monthly Backups to Keep
+                setting_num = 17
+                _edit_setting(console, setting_num, prefs, save_user_preference)
+            elif key.lower() == 'l':  # Yearly Backups
+                setting_num = 18
+                _edit_setting(console, setting_num, prefs, save_user_preference)
             elif key.lower() == 'd':  # Display Timezone
                 setting_num = 13
                 _edit_setting(console, setting_num, prefs, save_user_preference)
@@ -312,6 +321,9 @@ def _display_settings_menu(console: Console, prefs: dict, machine_name: str, db_
     from src.config.user_config import (
         get_backup_enabled,
         get_backup_keep_monthly,
+        get_backup_keep_monthly_count,
+        get_backup_keep_weekly,
+        get_backup_keep_yearly,
         get_backup_retention_days,
     )
 
@@ -324,6 +336,15 @@ def _display_settings_menu(console: Console, prefs: dict, machine_name: str, db_
     retention_days = get_backup_retention_days()
     settings_table.add_row("[#ff8800]\\[c][/#ff8800]", "Backup Retention (days)", str(retention_days))
 
+    keep_weekly = get_backup_keep_weekly()
+    settings_table.add_row("[#ff8800]\\[j][/#ff8800]", "Weekly Backups (weeks)", str(keep_weekly))
+
+    keep_monthly_count = get_backup_keep_monthly_count()
+    settings_table.add_row("[#ff8800]\\[k][/#ff8800]", "Monthly Backups (months)", "All" if keep_monthly_count is None else str(keep_monthly_count))
+
+    keep_yearly = get_backup_keep_yearly()
+    settings_table.add_row("[#ff8800]\\[l][/#ff8800]", "Yearly Backups (years)", str(keep_yearly))
+
     # Timezone setting
     if tz_setting == 'auto':
         tz_value = f"Auto ({tz_info['abbr']})"
@@ -357,7 +378,7 @@ def _edit_setting(console: Console, setting_num: int, prefs: dict, save_func) ->
 
     Args:
         console: Rich console for rendering
-        setting_num: Number of the setting to edit (1-15)
+        setting_num: Number of the setting to edit (1-18)
         prefs: Current preferences dictionary
         save_func: Function to save preference
     """
@@ -379,8 +400,8 @@ def _edit_setting(console: Console, setting_num: int, prefs: dict, save_func) ->
 
     # Note: Model pricing (6, 7) is read-only - edit src/config/defaults.py to change
 
-    # Handle backup settings separately (10, 11, 12)
-    if setting_num in [10, 11, 12]:
+    # Handle backup settings separately (10, 11, 12, 16, 17, 18)
+    if setting_num in [10, 11, 12, 16, 17, 18]:
         _edit_backup_setting(console, setting_num)
         return
 
@@ -496,17 +517,23 @@ def _show_pricing_readonly_message(console: Console) -> None:
 
 def _edit_backup_setting(console: Console, setting_num: int) -> None:
     """
-    Edit backup-related settings (10, 11, 12).
+    Edit backup-related settings (10, 11, 12, 16, 17, 18).
 
     Args:
         console: Rich console for rendering
-        setting_num: Setting number (10, 11, or 12)
+        setting_num: Setting number (10, 11, 12, 16, 17, or 18)
     """
     from src.config.user_config import (
         get_backup_enabled,
         set_backup_enabled,
         get_backup_keep_monthly,
         set_backup_keep_monthly,
+        get_backup_keep_monthly_count,
+        set_backup_keep_monthly_count,
+        get_backup_keep_weekly,
+        set_backup_keep_weekly,
+        get_backup_keep_yearly,
+        set_backup_keep_yearly,
         get_backup_retention_days,
         set_backup_retention_days,
     )
@@ -544,7 +571,7 @@ def _edit_backup_setting(console: Console, setting_num: int) -> None:
         console.print("[bold]Edit Keep Monthly Backups[/bold]")
         console.print(f"[dim]Current value: {'Yes' if current else 'No'}[/dim]")
         console.print(f"[dim]Default value: Yes[/dim]")
-        console.print("[dim]Keep backups from the 1st of each month permanently?[/dim]")
+        console.print("[dim]Keep backups from the 1st of each month (see \\[k] for how many)?[/dim]")
         console.print("[dim]Enter 'yes', 'no', 'd' for default, or press Enter to keep current:[/dim]")
 
         try:
@@ -557,7 +584,7 @@ def _edit_backup_setting(console: Console, setting_num: int) -> None:
                 console.print("[green]✓ Keep Monthly Backups reset to default: Yes[/green]")
             elif new_value in ['yes', 'y', 'true', '1']:
                 set_backup_keep_monthly(True)
-                console.print("[green]✓ Monthly backups will be kept permanently[/green]")
+                console.print("[green]✓ Monthly backups will be kept[/green]")
             elif new_value in ['no', 'n', 'false', '0']:
                 set_backup_keep_monthly(False)
                 console.print("[green]✓ Monthly backups will be deleted after retention period[/green]")
@@ -594,6 +621,100 @@ def _edit_backup_setting(console: Console, setting_num: int) -> None:
         except (EOFError, KeyboardInterrupt):
             console.print("\n[yellow]Input cancelled[/yellow]")
 
+    elif setting_num == 16:
+        # Weekly Backups (int)
+        current = get_backup_keep_weekly()
+        console.print("[bold]Edit Weekly Backups (weeks)[/bold]")
+        console.print(f"[dim]Current value: {current} weeks[/dim]")
+        console.print(f"[dim]Default value: 4 weeks[/dim]")
+        console.print("[dim]Beyond the retention period, keep the newest backup of each of the last N weeks.[/dim]")
+        console.print("[dim]Enter number of weeks (0 to disable), 'd' for default, or press Enter to keep current:[/dim]")
+
+        try:
+            sys.stdout.write("> ")
+            sys.stdout.flush()
+            new_value = input().strip()
+
+            if new_value:
+                if new_value.lower() in ['d', 'default']:
+                    set_backup_keep_weekly(4)
+                    console.print("[green]✓ Weekly backups reset to default: 4 weeks[/green]")
+                else:
+                    try:
+                        weeks = int(new_value)
+                        if weeks >= 0:
+                            set_backup_keep_weekly(weeks)
+                            console.print(f"[green]✓ Weekly backups set to {weeks} weeks[/green]")
+                        else:
+                            console.print("[red]✗ Weeks cannot be negative[/red]")
+                    except ValueError:
+                        console.print("[red]✗ Invalid number. Enter a number or 'd' for default[/red]")
+        except (EOFError, KeyboardInterrupt):
+            console.print("\n[yellow]Input cancelled[/yellow]")
+
+    elif setting_num == 17:
+        # Monthly Backups to keep (int, or None for all)
+        current = get_backup_keep_monthly_count()
+        console.print("[bold]Edit Monthly Backups (months)[/bold]")
+        console.print(f"[dim]Current value: {'All' if current is None else f'{current} months'}[/dim]")
+        console.print(f"[dim]Default value: All[/dim]")
+        console.print("[dim]Monthly backups are kept permanently by default. Enter a number to keep only[/dim]")
+        console.print("[dim]the last N months; older ones are deleted, except one per year (see \\[l]).[/dim]")
+        console.print("[dim]Enter number of months (minimum 1), 'all' or 'd' to keep all, or press Enter to keep current:[/dim]")
+
+        try:
+            sys.stdout.write("> ")
+            sys.stdout.flush()
+            new_value = input().strip()
+
+            if new_value:
+                if new_value.lower() in ['d', 'default', 'all']:
+                    set_backup_keep_monthly_count(None)
+                    console.print("[green]✓ All monthly backups will be kept permanently[/green]")
+                else:
+                    try:
+                        months = int(new_value)
+                        if months >= 1:
+                            set_backup_keep_monthly_count(months)
+                            console.print(f"[green]✓ Monthly backups will be kept for {months} months[/green]")
+                        else:
+                            console.print("[red]✗ Months must be at least 1[/red]")
+                    except ValueError:
+                        console.print("[red]✗ Invalid number. Enter a number, 'all', or 'd' for default[/red]")
+        except (EOFError, KeyboardInterrupt):
+            console.print("\n[yellow]Input cancelled[/yellow]")
+
+    elif setting_num == 18:
+        # Yearly Backups (int)
+        current = get_backup_keep_yearly()
+        console.print("[bold]Edit Yearly Backups (years)[/bold]")
+        console.print(f"[dim]Current value: {current} years[/dim]")
+        console.print(f"[dim]Default value: 5 years[/dim]")
+        console.print("[dim]When monthly backups are limited (\\[k]), keep the newest monthly backup of each of the last N years.[/dim]")
+        console.print("[dim]Enter number of years (0 to disable), 'd' for default, or press Enter to keep current:[/dim]")
+
+        try:
+            sys.stdout.write("> ")
+            sys.stdout.flush()
+            new_value = input().strip()
+
+            if new_value:
+                if new_value.lower() in ['d', 'default']:
+                    set_backup_keep_yearly(5)
+                    console.print("[green]✓ Yearly backups reset to default: 5 years[/green]")
+                else:
+                    try:
+                        years = int(new_value)
+                        if years >= 0:
+                            set_backup_keep_yearly(years)
+                            console.print(f"[green]✓ Yearly backups set to {years} years[/green]")
+                        else:
+                            console.print("[red]✗ Years cannot be negative[/red]")
+                    except ValueError:
+                        console.print("[red]✗ Invalid number. Enter a number or 'd' for default[/red]")
+        except (EOFError, KeyboardInterrupt):
+            console.print("\n[yellow]Input cancelled[/yellow]")
+
     console.print("\n[dim]Press any key to continue...[/dim]")
     _read_key()
 
@@ -819,6 +940,7 @@ def _reset_to_defaults(console: Console, save_func) -> None:
     console.print("[dim]  • Auto Backup (Enabled)[/dim]")
     console.print("[dim]  • Keep Monthly Backups (Yes)[/dim]")
     console.print("[dim]  • Backup Retention (30 days)[/dim]")
+    console.print("[dim]  • Weekly / Monthly / Yearly Backups (4 weeks / All / 5 years)[/dim]")
     console.print("[dim]  • Display Timezone (Auto)[/dim]")
     console.print()
     console.print("[dim]After reset, default values from src/config/defaults.py will be used.[/dim]")
@@ -842,11 +964,17 @@ def _reset_to_defaults(console: Console, save_func) -> None:
             from src.config.user_config import (
                 set_backup_enabled,
                 set_backup_keep_monthly,
+                set_backup_keep_monthly_count,
+                set_backup_keep_weekly,
+                set_backup_keep_yearly,
                 set_backup_retention_days,
             )
             set_backup_enabled(True)
             set_backup_keep_monthly(True)
             set_backup_retention_days(30)
+            set_backup_keep_weekly(4)
+            set_backup_keep_monthly_count(None)
+            set_backup_keep_yearly(5)
 
             # Reset model pricing to defaults
             from src.storage.snapshot_db import reset_pricing_to_defaults
@@ -131,6 +131,9 @@ def get_default_config() -> dict:
         "backup_enabled": True,  # Enable automatic backups
         "backup_keep_monthly": True,  # Keep monthly backups (1st of each month)
         "backup_retention_days": 30,  # Number of days to keep backups
+        "backup_keep_weekly": 4,  # Number of weeks to keep one backup for
+        "backup_keep_monthly_count": None,  # Months of monthly backups to keep (None = all)
+        "backup_keep_yearly": 5,  # Years to keep one monthly backup for (if count set)
         "last_backup_date": None,  # Last backup date (YYYY-MM-DD)
         "version": "1.0"
     }
@@ -323,7 +326,9 @@ def set_backup_enabled(enabled: bool) -> None:
 
 def get_backup_keep_monthly() -> bool:
     """
-    Get whether monthly backups (1st of each month) should be kept permanently.
+    Get whether monthly backups (1st of each month) should be kept.
+
+    They are kept permanently unless get_backup_keep_monthly_count is set.
 
     Returns:
         True if monthly backups should be kept, False otherwise
@@ -334,7 +339,7 @@ def get_backup_keep_monthly() -> bool:
 
 def set_backup_keep_monthly(keep: bool) -> None:
     """
-    Set whether to keep monthly backups permanently.
+    Set whether to keep monthly backups beyond the retention period.
 
     Args:
         keep: True to keep monthly backups, False to delete them normally
@@ -373,6 +378,104 @@ def set_backup_retention_days(days: int) -> None:
     save_config(config)
 
 
+def get_backup_keep_weekly() -> int:
+    """
+    Get the number of recent weeks to keep one backup for.
+
+    Applies beyond the retention period: the newest backup of each of the
+    last N calendar weeks is kept.
+
+    Returns:
+        Number of weeks (default: 4)
+    """
+    config = load_config()
+    return config.get("backup_keep_weekly", 4)
+
+
+def set_backup_keep_weekly(weeks: int) -> None:
+    """
+    Set the number of recent weeks to keep one backup for.
+
+    Args:
+        weeks: Number of weeks (0 disables the weekly tier)
+
+    Raises:
+        ValueError: If weeks is negative
+    """
+    if weeks < 0:
+        raise ValueError("Weekly backup count cannot be negative")
+
+    config = load_config()
+    config["backup_keep_weekly"] = weeks
+    save_config(config)
+
+
+def get_backup_keep_monthly_count() -> Optional[int]:
+    """
+    Get how many months of monthly backups to keep.
+
+    Only used while monthly backups are enabled (see get_backup_keep_monthly).
+    None keeps every monthly backup permanently; setting a number opts in to
+    thinning them out.
+
+    Returns:
+        Number of months, or None to keep all (default: None)
+    """
+    config = load_config()
+    return config.get("backup_keep_monthly_count")
+
+
+def set_backup_keep_monthly_count(months: Optional[int]) -> None:
+    """
+    Set how many months of monthly backups to keep.
+
+    Args:
+        months: Number of months (at least 1), or None to keep all permanently
+
+    Raises:
+        ValueError: If months is less than 1
+    """
+    if months is not None and months < 1:
+        raise ValueError("Monthly backup count must be at least 1")
+
+    config = load_config()
+    config["backup_keep_monthly_count"] = months
+    save_config(config)
+
+
+def get_backup_keep_yearly() -> int:
+    """
+    Get the number of recent years to keep one monthly backup for.
+
+    Only used once monthly backups are thinned out (see
+    get_backup_keep_monthly_count): the newest monthly backup of each of
+    the last N years is kept beyond that window.
+
+    Returns:
+        Number of years (default: 5)
+    """
+    config = load_config()
+    return config.get("backup_keep_yearly", 5)
+
+
+def set_backup_keep_yearly(years: int) -> None:
+    """
+    Set the number of recent years to keep one monthly backup for.
+
+    Args:
+        years: Number of years (0 disables the yearly tier)
+
+    Raises:
+        ValueError: If years is negative
+    """
+    if years < 0:
+        raise ValueError("Yearly backup count cannot be negative")
+
+    config = load_config()
+    config["backup_keep_yearly"] = years
+    save_config(config)
+
+
 def get_last_backup_date() -> Optional[str]:
     """
     Get the date of the last successful backup.
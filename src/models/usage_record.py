@@ -1,7 +1,7 @@
 #region Imports
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 #endregion
 
 
@@ -67,6 +67,71 @@ class UsageRecord:
     content: Optional[str] = None
     char_count: int = 0
 
+    @classmethod
+    def from_db_row(
+        cls,
+        *,
+        timestamp: str,
+        session_id: str,
+        message_uuid: str,
+        message_type: str,
+        model: Optional[str],
+        folder: str,
+        git_branch: Optional[str],
+        version: str,
+        token_usage: Optional[TokenUsage],
+        content: Optional[str] = None,
+    ) -> "UsageRecord":
+        """
+        Create a record from stored columns, parsing the timestamp lazily.
+
+        The stored ISO 8601 string is kept privately and only parsed on the
+        first ``timestamp`` access, so callers that never read it (e.g. token
+        totals) don't pay for datetime.fromisoformat() on every row.
+
+        Args:
+            timestamp: Stored ISO 8601 timestamp string
+            session_id: UUID of the conversation session
+            message_uuid: UUID of the specific message
+            message_type: Type of message ('user' or 'assistant')
+            model: Model name
+            folder: Project folder path
+            git_branch: Current git branch (if available)
+            version: Claude Code version
+            token_usage: Token usage details (None for user messages)
+            content: Message content text
+
+        Returns:
+            UsageRecord equal to one constructed with the parsed timestamp
+        """
+        record = cls.__new__(cls)
+        record.__dict__.update(
+            _raw_timestamp=timestamp,
+            session_id=session_id,
+            message_uuid=message_uuid,
+            message_type=message_type,
+            model=model,
+            folder=folder,
+            git_branch=git_branch,
+            version=version,
+            token_usage=token_usage,
+            content=content,
+            char_count=0,
+        )
+        return record
+
+    if not TYPE_CHECKING:
+        def __getattr__(self, name: str):
+            # Only reached when normal lookup fails, i.e. for the not yet
+            # parsed timestamp of a record from from_db_row()
+            if name == "timestamp" and "_raw_timestamp" in self.__dict__:
+                timestamp = datetime.fromisoformat(self.__dict__["_raw_timestamp"])
+                self.__dict__["timestamp"] = timestamp
+                return timestamp
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
     @property
     def date_key(self) -> str:
         """
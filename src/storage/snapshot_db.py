@@ -1,15 +1,22 @@
 #region Imports
+import atexit
 import os
 import platform
 import re
 import sqlite3
 import pickle
+import threading
+import time
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
+from zoneinfo import ZoneInfo
 
 from src.models.usage_record import UsageRecord, TokenUsage
+from src.utils.timezone import clear_timezone_cache, get_user_timezone
 from src.aggregation.summary import (
     DailyTotal,
     ModelTotal,
@@ -35,14 +42,175 @@ _merged_records_cache: list[UsageRecord] | None = None
 _database_stats_cache: dict | None = None
 _database_stats_cache_time: float = 0
 
+# Cache for text analysis stats, keyed by (db_path, mtime_ns, size)
+_text_stats_cache: dict | None = None
+_text_stats_cache_key: tuple | None = None
+_text_stats_cache_time: float = 0
+
+# Databases whose user_preferences table has already been read successfully
+_prefs_table_verified: set[Path] = set()
+
+# Databases already initialized by init_database() in this process, mapped
+# to the PRAGMA user_version written then. A file whose header no longer
+# shows that version (deleted, recreated, replaced) is initialized again.
+_initialized_dbs: dict[Path, int] = {}
+_init_lock = threading.Lock()
+
+# Bump when _init_database() gains a table, column, index or data migration.
+# Stored as PRAGMA user_version.
+_SCHEMA_VERSION = 2
+
 # Persistent device cache settings
-_DEVICE_CACHE_VERSION = 2
+_DEVICE_CACHE_VERSION = 4
 _DEVICE_CACHE_TTL_SECONDS = 6 * 60 * 60  # 6 hours
 _CACHE_FILENAME_SANITIZER = re.compile(r"[^A-Za-z0-9_.-]+")
 _CACHE_EXTENSION = ".pkl"
 _CACHE_LEGACY_EXTENSION = ".json"
 _RECENT_USAGE_DEFAULT_EXTRA_DAYS = 7
 
+# Max values bound per "IN (?, ?, ...)" query (SQLite's historical limit is 999)
+_SQL_PARAM_BATCH_SIZE = 500
+
+# usage_records.message_type_code values (narrower than the TEXT column in indexes)
+_MESSAGE_TYPE_CODES = {"user": 0, "assistant": 1}
+_MESSAGE_TYPE_CODE_OTHER = 2
+
+# Hot read queries, kept as module constants: the cached read connections
+# (see _get_ro_conn) reuse their compiled statements across calls.
+
+# Per-machine totals: completed months from device_monthly_stats plus the
+# current month from usage_records. Params: (machine_name, current_month)
+_SQL_DEVICE_STATS = """
+    WITH monthly_agg AS (
+        SELECT
+            COALESCE(SUM(total_records), 0) as total_records,
+            COALESCE(SUM(total_sessions), 0) as total_sessions,
+            COALESCE(SUM(total_messages), 0) as total_messages,
+            COALESCE(SUM(total_tokens), 0) as total_tokens,
+            COALESCE(SUM(input_tokens), 0) as input_tokens,
+            COALESCE(SUM(output_tokens), 0) as output_tokens,
+            COALESCE(SUM(cache_creation_tokens), 0) as cache_creation_tokens,
+            COALESCE(SUM(cache_read_tokens), 0) as cache_read_tokens,
+            COALESCE(SUM(total_cost), 0.0) as total_cost,
+            MIN(oldest_date) as oldest_date,
+            MAX(newest_date) as newest_date
+        FROM device_monthly_stats
+        WHERE machine_name = ?
+    ),
+    current_month_agg AS (
+        SELECT
+            COUNT(*) as total_records,
+            COUNT(DISTINCT session_id) as total_sessions,
+            COUNT(CASE WHEN message_type = 'assistant' THEN 1 END) as total_messages,
+            COALESCE(SUM(ur.total_tokens), 0) as total_tokens,
+            COALESCE(SUM(ur.input_tokens), 0) as input_tokens,
+            COALESCE(SUM(ur.output_tokens), 0) as output_tokens,
+            COALESCE(SUM(ur.cache_creation_tokens), 0) as cache_creation_tokens,
+            COALESCE(SUM(ur.cache_read_tokens), 0) as cache_read_tokens,
+            MIN(ur.date) as oldest_date,
+            MAX(ur.date) as newest_date,
+            -- Per-row cost is stored on insert (NULL for unpriced rows)
+            COALESCE(SUM(ur.cost), 0.0) as total_cost
+        FROM usage_records ur
+        WHERE substr(ur.date, 1, 7) = ?
+    )
+    SELECT
+        m.total_records + c.total_records as total_records,
+        m.total_sessions + c.total_sessions as total_sessions,
+        m.total_messages + c.total_messages as total_messages,
+        m.total_tokens + c.total_tokens as total_tokens,
+        m.input_tokens + c.input_tokens as input_tokens,
+        m.output_tokens + c.output_tokens as output_tokens,
+        m.cache_creation_tokens + c.cache_creation_tokens as cache_creation_tokens,
+        m.cache_read_tokens + c.cache_read_tokens as cache_read_tokens,
+        m.total_cost + c.total_cost as total_cost,
+        -- Scalar MIN()/MAX() return NULL if either side is NULL (no completed
+        -- months, or nothing this month), so fall back to the other side
+        MIN(COALESCE(m.oldest_date, c.oldest_date), COALESCE(c.oldest_date, m.oldest_date)) as oldest_date,
+        MAX(COALESCE(m.newest_date, c.newest_date), COALESCE(c.newest_date, m.newest_date)) as newest_date
+    FROM monthly_agg m, current_month_agg c
+"""
+
+# usage_records counts/date range and daily_snapshots totals in one row
+_SQL_DATABASE_TOTALS = """
+    SELECT
+        u.total_records, u.total_days, u.oldest_date, u.newest_date,
+        d.newest_timestamp,
+        d.total_tokens, d.total_prompts, d.total_responses, d.total_sessions
+    FROM (
+        SELECT
+            COUNT(*) as total_records,
+            COUNT(DISTINCT date) as total_days,
+            MIN(date) as oldest_date,
+            MAX(date) as newest_date
+        FROM usage_records
+    ) u, (
+        SELECT
+            MAX(snapshot_timestamp) as newest_timestamp,
+            SUM(total_tokens) as total_tokens,
+            SUM(total_prompts) as total_prompts,
+            SUM(total_responses) as total_responses,
+            SUM(total_sessions) as total_sessions
+        FROM daily_snapshots
+    ) d
+"""
+
+# Fallback for _SQL_DATABASE_TOTALS when daily_snapshots is empty but
+# usage_records is not: the same per-day rollup save_snapshot() stores,
+# summed over every date
+_SQL_USAGE_TOTALS = """
+    SELECT
+        SUM(total_tokens), SUM(total_prompts), SUM(total_responses), SUM(total_sessions)
+    FROM (
+        SELECT
+            SUM(total_tokens) as total_tokens,
+            SUM(CASE WHEN message_type = 'user' THEN 1 ELSE 0 END) as total_prompts,
+            SUM(CASE WHEN message_type = 'assistant' THEN 1 ELSE 0 END) as total_responses,
+            COUNT(DISTINCT session_id) as total_sessions
+        FROM usage_records
+        GROUP BY date
+    )
+"""
+
+# Per-model token totals and stored cost, largest token count first.
+# model_totals is maintained by triggers (see init_database()); the
+# aggregate over usage_records serves databases created before it existed.
+_SQL_MODEL_TOTALS = """
+    SELECT model, total_tokens, cost
+    FROM model_totals
+    ORDER BY total_tokens DESC
+"""
+
+_SQL_MODEL_TOTALS_FROM_RECORDS = """
+    SELECT
+        model,
+        SUM(total_tokens) as tokens,
+        COALESCE(SUM(cost), 0.0) as model_cost
+    FROM usage_records
+    WHERE model IS NOT NULL
+    GROUP BY model
+    ORDER BY tokens DESC
+"""
+
+# Recompute stored usage_records.cost from model_pricing (same formula as
+# the save_snapshot() INSERT). Appended WHERE clause selects the rows.
+_SQL_RECOMPUTE_COST = """
+    UPDATE usage_records
+    SET cost = (
+        SELECT
+            (usage_records.input_tokens / 1000000.0) * input_price_per_mtok +
+            (usage_records.output_tokens / 1000000.0) * output_price_per_mtok +
+            (usage_records.cache_creation_tokens / 1000000.0) * cache_write_price_per_mtok +
+            (usage_records.cache_read_tokens / 1000000.0) * cache_read_price_per_mtok
+        FROM model_pricing
+        WHERE model_name = usage_records.model
+    )
+"""
+
+# Platform detection (computed once; platform.system()/release() can be slow)
+_IS_WSL = platform.system() == "Linux" and "microsoft" in platform.release().lower()
+_IS_MACOS = platform.system() == "Darwin"
+
 
 
 def _get_device_cache_dir() -> Optional[Path]:
@@ -392,10 +560,9 @@ def update_global_usage_summaries(
         except Exception:
             pass
 
-        conn = sqlite3.connect(machine_db, timeout=30.0)
+        conn = _open_conn(machine_db, readonly=True)
         try:
             cursor = conn.cursor()
-            cursor.execute("PRAGMA query_only = ON")
 
             if dates_needed:
                 placeholders = ",".join("?" * len(dates_needed))
@@ -679,7 +846,7 @@ def update_global_usage_summaries(
 
     timestamp = datetime.now(timezone.utc).isoformat()
 
-    base_conn = sqlite3.connect(base_db_path, timeout=30.0)
+    base_conn = _open_conn(base_db_path)
     try:
         cursor = base_conn.cursor()
         cursor.execute("PRAGMA busy_timeout = 30000")
@@ -956,38 +1123,47 @@ def load_usage_summary(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
 ) -> UsageSummary:
-    init_database(DEFAULT_DB_PATH)
-
     def _ensure_summary_data() -> None:
-        conn_check = sqlite3.connect(DEFAULT_DB_PATH, timeout=30.0)
+        # Only touch the schema when the database or its summary tables are
+        # missing; the common case is a read-only check on an existing DB
+        if not DEFAULT_DB_PATH.exists():
+            init_database(DEFAULT_DB_PATH)
+            update_global_usage_summaries()
+            return
+
+        tables_to_check = [
+            "global_daily_summary",
+            "global_weekly_summary",
+            "global_monthly_summary",
+            "global_model_summary",
+            "global_project_summary",
+        ]
+
+        conn_check = _get_ro_conn(DEFAULT_DB_PATH)
         try:
             cursor_check = conn_check.cursor()
-            tables_to_check = [
-                "global_daily_summary",
-                "global_weekly_summary",
-                "global_monthly_summary",
-                "global_model_summary",
-                "global_project_summary",
-            ]
-
             needs_update = False
             for table in tables_to_check:
-                cursor_check.execute(f"SELECT COUNT(*) FROM {table}")
-                if cursor_check.fetchone()[0] == 0:
+                cursor_check.execute(f"SELECT EXISTS(SELECT 1 FROM {table})")
+                if not cursor_check.fetchone()[0]:
                     needs_update = True
                     break
-        finally:
-            conn_check.close()
+        except sqlite3.OperationalError:
+            # Summary tables don't exist yet (database predates them)
+            needs_update = True
+            _release_ro_conn(conn_check)
+            init_database(DEFAULT_DB_PATH)
+        else:
+            _release_ro_conn(conn_check)
 
         if needs_update:
             update_global_usage_summaries()
 
     _ensure_summary_data()
 
-    conn = sqlite3.connect(DEFAULT_DB_PATH, timeout=30.0)
+    conn = _get_ro_conn(DEFAULT_DB_PATH)
     try:
         cursor = conn.cursor()
-        cursor.execute("PRAGMA query_only = ON")
 
         daily_filters: list[str] = []
         params: list[str] = []
@@ -1019,7 +1195,6 @@ def load_usage_summary(
             """,
             params,
         )
-        daily_rows = cursor.fetchall()
 
         daily_totals = {
             row[0]: DailyTotal(
@@ -1034,7 +1209,7 @@ def load_usage_summary(
                 cache_read_tokens=row[8] or 0,
                 total_cost=float(row[9] or 0.0),
             )
-            for row in daily_rows
+            for row in cursor
         }
 
         overall = DailyTotal(date="all")
@@ -1073,7 +1248,7 @@ def load_usage_summary(
                 cache_read_tokens=row[5] or 0,
                 total_cost=float(row[6] or 0.0),
             )
-            for row in cursor.fetchall()
+            for row in cursor
             if row[0]
         }
 
@@ -1093,11 +1268,11 @@ def load_usage_summary(
                 total_tokens=row[1] or 0,
                 total_cost=float(row[2] or 0.0),
             )
-            for row in cursor.fetchall()
+            for row in cursor
             if row[0]
         }
     finally:
-        conn.close()
+        _release_ro_conn(conn)
 
     return UsageSummary(
         totals=overall,
@@ -1161,6 +1336,23 @@ def _try_create_folder(path: Path) -> bool:
     return False
 
 
+@lru_cache(maxsize=1)
+def _get_mount_points() -> Optional[frozenset[str]]:
+    """
+    Read the set of mount points from /proc/mounts (parsed once per process).
+
+    Returns:
+        Frozen set of mount point paths, or None if /proc/mounts is unreadable
+    """
+    try:
+        with open("/proc/mounts", "r") as f:
+            return frozenset(
+                fields[1] for fields in (line.split() for line in f) if len(fields) > 1
+            )
+    except OSError:
+        return None
+
+
 def get_storage_dir() -> Path:
     """
     Get the base storage directory for databases.
@@ -1193,7 +1385,7 @@ def get_storage_dir() -> Path:
         return Path(custom_path).parent
 
     # WSL2 OneDrive detection
-    if platform.system() == "Linux" and "microsoft" in platform.release().lower():
+    if _IS_WSL:
         username = os.getenv("USER")
         onedrive_candidates = []
 
@@ -1206,6 +1398,15 @@ def get_storage_dir() -> Path:
         if username:
             onedrive_candidates.append(Path(f"/mnt/c/Users/{username}/OneDrive"))
 
+        # Skip drives that aren't mounted: stat()ing /mnt/x/OneDrive goes
+        # through the 9p bridge to NTFS, while /proc/mounts is read once
+        mount_points = _get_mount_points()
+        if mount_points is not None:
+            onedrive_candidates = [
+                candidate for candidate in onedrive_candidates
+                if str(Path(*candidate.parts[:3])) in mount_points  # /mnt/{drive}
+            ]
+
         for onedrive_base in onedrive_candidates:
             if onedrive_base.exists():
                 storage_dir = onedrive_base / ".claude-goblin"
@@ -1213,7 +1414,7 @@ def get_storage_dir() -> Path:
                     return storage_dir
 
     # macOS iCloud Drive detection
-    elif platform.system() == "Darwin":
+    elif _IS_MACOS:
         icloud_base = Path.home() / "Library" / "Mobile Documents" / "com~apple~CloudDocs"
         if icloud_base.exists():
             storage_dir = icloud_base / ".claude-goblin"
@@ -1267,6 +1468,7 @@ def get_all_machine_db_paths() -> list[tuple[str, Path]]:
         return [(machine_name, storage_dir / f"usage_history_{machine_name}.db")]
 
 
+@lru_cache(maxsize=1)
 def get_default_db_path() -> Path:
     """
     Get the database path for the current machine.
@@ -1274,6 +1476,9 @@ def get_default_db_path() -> Path:
     This is the main function used throughout the codebase.
     Now returns PC-specific DB path: usage_history_{machine_name}.db
 
+    The result is cached for the lifetime of the process (like DEFAULT_DB_PATH),
+    so OneDrive/iCloud drive detection only runs once.
+
     Returns:
         Path to the current machine's database file
     """
@@ -1289,6 +1494,265 @@ DEFAULT_DB_PATH = get_default_db_path()
 #region Functions
 
 
+# Per-connection tuning for read paths: larger page cache (negative = KiB),
+# in-memory temp tables for sorts/GROUP BY, and memory-mapped reads
+_READ_PRAGMAS = (
+    "PRAGMA cache_size=-16000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _open_ro(db_path: Path, check_same_thread: bool = True) -> sqlite3.Connection:
+    """
+    Open a read-only connection to a database file.
+
+    Read-only handles never escalate past a SHARED lock, so dashboard reads
+    don't contend with the writer (or OneDrive sync) on the same file.
+
+    Args:
+        db_path: Path to an existing SQLite database file
+        check_same_thread: Passed through to sqlite3.connect()
+
+    Returns:
+        Read-only SQLite connection with read PRAGMAs applied
+    """
+    uri = f"{db_path.resolve().as_uri()}?mode=ro&cache=private"
+    conn = sqlite3.connect(uri, uri=True, timeout=30.0, check_same_thread=check_same_thread)
+    for pragma in _READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+# Per-connection tuning for read/write connections. journal_mode is left alone:
+# init_database() sets DELETE mode on purpose, since WAL's -wal/-shm side files
+# don't survive OneDrive sync between machines. synchronous likewise stays at
+# its FULL default. mmap only serves reads; writes still go through the
+# journal, but the daily/global summary rebuilds read a lot of pages.
+_WRITE_PRAGMAS = (
+    "PRAGMA cache_size=-16000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _open_conn(
+    db_path: Path,
+    readonly: bool = False,
+    check_same_thread: bool = True,
+) -> sqlite3.Connection:
+    """
+    Open a connection to a database file with this module's PRAGMAs applied.
+
+    Args:
+        db_path: Path to the SQLite database file
+        readonly: Open a read-only connection (the file must already exist)
+        check_same_thread: Passed through to sqlite3.connect()
+
+    Returns:
+        SQLite connection
+    """
+    if readonly:
+        return _open_ro(db_path, check_same_thread=check_same_thread)
+
+    # 30 second timeout for OneDrive sync
+    conn = sqlite3.connect(db_path, timeout=30.0, check_same_thread=check_same_thread)
+    for pragma in _WRITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+# Per-thread connections to DEFAULT_DB_PATH (one read-only, one read/write),
+# reused across calls so a dashboard render or a save doesn't reconnect (and
+# re-warm the page cache) per call. Both kinds are cached: reads and writes
+# to the local database go through _get_ro_conn()/_get_rw_conn(), while
+# other machines' files always get a fresh connection.
+_tls = threading.local()
+_cached_conns: dict[sqlite3.Connection, str] = {}  # connection -> _tls attribute
+_cached_conns_lock = threading.Lock()
+_cached_conns_generation = 0  # Bumped by close_cached_connections()
+
+# PRAGMA optimize cadence for cached write connections: on the first release
+# (so short CLI runs optimize once, after their save), then at most this often
+_OPTIMIZE_INTERVAL_SECONDS = 15 * 60
+_last_optimize_time: Optional[float] = None
+
+
+def _get_cached_conn(db_path: Path, attr: str, open_conn) -> sqlite3.Connection:
+    """
+    Get this thread's cached connection to db_path stored under _tls.<attr>.
+
+    The cached connection is reopened if the file itself was replaced (e.g.
+    restored from a backup) or close_cached_connections() ran since.
+
+    Args:
+        db_path: Path to the SQLite database file (DEFAULT_DB_PATH)
+        attr: Thread-local attribute holding (connection, file id)
+        open_conn: Callable opening a new connection usable from any thread
+
+    Returns:
+        SQLite connection
+    """
+    try:
+        stat = db_path.stat()
+    except OSError:
+        return open_conn()  # Not cached; let sqlite3 create or fail as usual
+    file_id = (stat.st_dev, stat.st_ino, _cached_conns_generation)
+
+    cached = getattr(_tls, attr, None)
+    if cached is not None:
+        conn, cached_file_id = cached
+        if cached_file_id == file_id:
+            return conn
+        setattr(_tls, attr, None)
+        with _cached_conns_lock:
+            # Not already closed by close_cached_connections()
+            if _cached_conns.pop(conn, None) is not None:
+                conn.close()
+
+    conn = open_conn()
+    setattr(_tls, attr, (conn, file_id))
+    with _cached_conns_lock:
+        _cached_conns[conn] = attr
+    return conn
+
+
+def _is_cached_conn(conn: sqlite3.Connection, attr: str) -> bool:
+    """Whether conn is this thread's cached connection under _tls.<attr>."""
+    cached = getattr(_tls, attr, None)
+    return cached is not None and cached[0] is conn
+
+
+def _get_ro_conn(db_path: Path) -> sqlite3.Connection:
+    """
+    Get a read-only connection, reusing this thread's one for DEFAULT_DB_PATH.
+
+    Only the current machine's database is kept open: other machines' files
+    are replaced by OneDrive sync, which an open handle would block on Windows.
+    Pair every call with _release_ro_conn().
+
+    Args:
+        db_path: Path to an existing SQLite database file
+
+    Returns:
+        Read-only SQLite connection
+    """
+    if db_path != DEFAULT_DB_PATH:
+        return _open_ro(db_path)
+
+    # check_same_thread=False so close_cached_connections() can close it from any thread
+    return _get_cached_conn(db_path, "ro_conn", lambda: _open_ro(db_path, check_same_thread=False))
+
+
+def _release_ro_conn(conn: sqlite3.Connection) -> None:
+    """
+    Release a connection from _get_ro_conn(), closing it unless it is cached.
+
+    Args:
+        conn: Connection returned by _get_ro_conn()
+    """
+    if not _is_cached_conn(conn, "ro_conn"):
+        conn.close()
+
+
+def _get_rw_conn(db_path: Path) -> sqlite3.Connection:
+    """
+    Get a read/write connection, reusing this thread's one for DEFAULT_DB_PATH.
+
+    Same caching rules as _get_ro_conn(). Pair every call with
+    _release_rw_conn(), which rolls back anything left uncommitted.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        SQLite connection
+    """
+    if db_path != DEFAULT_DB_PATH:
+        return _open_conn(db_path)
+
+    return _get_cached_conn(db_path, "rw_conn", lambda: _open_conn(db_path, check_same_thread=False))
+
+
+def _release_rw_conn(conn: sqlite3.Connection) -> None:
+    """
+    Release a connection from _get_rw_conn(), closing it unless it is cached.
+
+    A cached connection is kept open, so a transaction an exception left
+    open is rolled back here (closing would have done that implicitly).
+    The query planner statistics are refreshed through it on the first
+    release and then at most every _OPTIMIZE_INTERVAL_SECONDS.
+
+    Args:
+        conn: Connection returned by _get_rw_conn()
+    """
+    global _last_optimize_time
+
+    if not _is_cached_conn(conn, "rw_conn"):
+        _optimize_conn(conn)
+        conn.close()
+        return
+
+    if conn.in_transaction:
+        conn.rollback()
+
+    now = time.monotonic()
+    if _last_optimize_time is None or now - _last_optimize_time >= _OPTIMIZE_INTERVAL_SECONDS:
+        _last_optimize_time = now
+        _optimize_conn(conn)
+
+
+def _optimize_conn(conn: sqlite3.Connection) -> None:
+    """
+    Run PRAGMA optimize (incremental ANALYZE where stats are stale).
+
+    Bounded by analysis_limit so it stays cheap on large tables. Failures
+    (read-only or busy database) are ignored: stats are only a planner hint.
+
+    Args:
+        conn: Open read/write connection
+    """
+    try:
+        conn.execute("PRAGMA analysis_limit=400")
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        pass
+
+
+def close_cached_connections(optimize: bool = True) -> None:
+    """
+    Close every cached connection (read-only and read/write, all threads).
+
+    Call it before deleting or replacing the database file, since Windows
+    refuses to remove a file that is still open. Connections other threads
+    obtained from _get_ro_conn()/_get_rw_conn() are closed as well, so this
+    must not run while another thread may be using one; their next
+    _get_*_conn() call opens a fresh connection.
+
+    Args:
+        optimize: Run PRAGMA optimize on the read/write connections first
+    """
+    global _cached_conns_generation
+
+    with _cached_conns_lock:
+        _cached_conns_generation += 1
+        for conn, attr in _cached_conns.items():
+            if optimize and attr == "rw_conn":
+                _optimize_conn(conn)
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        _cached_conns.clear()
+    # The files may be deleted or replaced next; re-check their schema
+    _prefs_table_verified.clear()
+    _initialized_dbs.clear()
+
+
+# Close (without optimizing) at interpreter exit
+atexit.register(close_cached_connections, optimize=False)
+
+
 def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
     """
     Initialize the SQLite database for historical snapshots.
@@ -1297,7 +1761,12 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
     - daily_snapshots: Daily aggregated usage data
     - usage_records: Individual usage records for detailed analysis
 
-    Enables WAL mode for better concurrent access (safe for multi-PC OneDrive sync).
+    Uses DELETE journal mode (a single .db file, safe for multi-PC OneDrive sync).
+
+    Each database file is initialized once per process. Later calls only
+    read its user_version from the file header and initialize it again if
+    the version differs from the one written (the file was deleted,
+    recreated or replaced since).
 
     Args:
         db_path: Path to the SQLite database file
@@ -1305,9 +1774,78 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
     Raises:
         sqlite3.Error: If database initialization fails
     """
+    if _is_initialized(db_path):
+        return
+
+    with _init_lock:
+        # Another thread may have finished initializing while we waited
+        if _is_initialized(db_path):
+            return
+        _initialized_dbs[db_path] = _init_database(db_path)
+
+
+def _is_initialized(db_path: Path) -> bool:
+    """Whether db_path was initialized in this process and still carries that version."""
+    version = _initialized_dbs.get(db_path)
+    return version is not None and _read_user_version(db_path) == version
+
+
+def _read_user_version(db_path: Path) -> Optional[int]:
+    """
+    Read PRAGMA user_version from the database file header without connecting.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Returns:
+        user_version (0 for an empty file), or None if the file doesn't exist
+    """
+    try:
+        with open(db_path, "rb") as f:
+            header = f.read(64)
+    except OSError:
+        return None
+    if len(header) < 64:
+        return 0
+    # Big-endian 32-bit integer at offset 60 of the 100-byte header
+    return int.from_bytes(header[60:64], "big", signed=True)
+
+
+def _default_pricing_rows(default_pricing: dict, timestamp: str) -> list[tuple]:
+    """
+    Build model_pricing rows from defaults.py's DEFAULT_MODEL_PRICING.
+
+    Args:
+        default_pricing: DEFAULT_MODEL_PRICING mapping
+        timestamp: last_updated value for every row
+
+    Returns:
+        (model_name, input, output, cache_write, cache_read, last_updated, notes) tuples
+    """
+    return [
+        (
+            model_name,
+            pricing_info['input_price'],
+            pricing_info['output_price'],
+            pricing_info['cache_write_price'],
+            pricing_info['cache_read_price'],
+            timestamp,
+            pricing_info.get('notes', ''),
+        )
+        for model_name, pricing_info in default_pricing.items()
+    ]
+
+
+def _init_database(db_path: Path) -> int:
+    """
+    Create/migrate the schema and seed defaults (see init_database()).
+
+    Returns:
+        PRAGMA user_version written to the database
+    """
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = sqlite3.connect(db_path, timeout=30.0)  # 30 second timeout for OneDrive sync
+    conn = _open_conn(db_path)
     should_update_global = False
 
     try:
@@ -1320,6 +1858,8 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
         cursor.execute("PRAGMA synchronous=FULL")    # Safer for cloud sync
         cursor.execute("PRAGMA busy_timeout=30000")  # 30 second busy timeout
 
+        stored_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+
         # Table for daily aggregated snapshots
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS daily_snapshots (
@@ -1359,28 +1899,46 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
             )
         """)
 
+        # Migrations: Add columns missing from older databases
+        # (read the column list once and check every migration against it)
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(usage_records)").fetchall()}
+
         # Migration: Add machine_name column if it doesn't exist
-        cursor.execute("PRAGMA table_info(usage_records)")
-        columns = [row[1] for row in cursor.fetchall()]
         if "machine_name" not in columns:
             cursor.execute("ALTER TABLE usage_records ADD COLUMN machine_name TEXT")
 
         # Migration: Add content column if it doesn't exist
-        cursor.execute("PRAGMA table_info(usage_records)")
-        columns = [row[1] for row in cursor.fetchall()]
         if "content" not in columns:
             cursor.execute("ALTER TABLE usage_records ADD COLUMN content TEXT")
 
-        # Migration: Add cost column if it doesn't exist
-        cursor.execute("PRAGMA table_info(usage_records)")
-        columns = [row[1] for row in cursor.fetchall()]
-        if "cost" not in columns:
+        # Migration: Add cost column if it doesn't exist (backfilled below,
+        # once model_pricing is populated)
+        backfill_cost = "cost" not in columns
+        if backfill_cost:
             cursor.execute("ALTER TABLE usage_records ADD COLUMN cost REAL")
 
-        # Index for faster date-based queries
+        # Migration: Add integer-encoded message type (0=user, 1=assistant, 2=other)
+        if "message_type_code" not in columns:
+            cursor.execute("ALTER TABLE usage_records ADD COLUMN message_type_code INTEGER")
+
+        # Fill in codes on every init, not just when the column is added:
+        # rows copied from older databases or written by older builds have
+        # none, and the daily/monthly rollups count prompts by code
+        cursor.execute("""
+            UPDATE usage_records
+            SET message_type_code = CASE message_type
+                WHEN 'user' THEN 0
+                WHEN 'assistant' THEN 1
+                ELSE 2
+            END
+            WHERE message_type_code IS NULL
+        """)
+
+        # Index for timestamp range queries (hourly message view, incremental
+        # loads after the last seen timestamp, MAX(timestamp) sync checks)
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_usage_records_date
-            ON usage_records(date)
+            CREATE INDEX IF NOT EXISTS idx_usage_records_timestamp
+            ON usage_records(timestamp)
         """)
 
         # Index for model-based queries (used in cost calculations)
@@ -1391,11 +1949,19 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
 
         # Composite index for date + model (optimizes monthly cost calculations)
         # This speeds up queries like: WHERE substr(date, 1, 7) = '2025-10' AND model = 'X'
+        # It also serves every date-only lookup (including the per-date
+        # rollup in save_snapshot()), so no separate date index is kept.
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_usage_records_date_model
             ON usage_records(date, model)
         """)
 
+        # Superseded date indexes: date alone is a prefix of date_model, and
+        # the rollup's covering indexes cost more per insert than they saved
+        cursor.execute("DROP INDEX IF EXISTS idx_usage_records_date")
+        cursor.execute("DROP INDEX IF EXISTS idx_usage_records_date_mtype_code")
+        cursor.execute("DROP INDEX IF EXISTS idx_usage_records_date_cover")
+
         # Table for usage limits snapshots
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS limits_snapshots (
@@ -1410,10 +1976,14 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
             )
         """)
 
-        # Index for faster date-based queries on limits
+        # Covering index for date-based queries on limits (get_limits_data()
+        # reads only these columns). Latest-snapshot lookups need no extra
+        # index: ORDER BY timestamp DESC LIMIT 1 walks the PRIMARY KEY
+        # index backwards. Supersedes the date-only index.
+        cursor.execute("DROP INDEX IF EXISTS idx_limits_snapshots_date")
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_limits_snapshots_date
-            ON limits_snapshots(date)
+            CREATE INDEX IF NOT EXISTS idx_limits_snapshots_date_pct
+            ON limits_snapshots(date, week_pct, opus_pct)
         """)
 
         # Table for model pricing
@@ -1617,31 +2187,119 @@ def init_database(db_path: Path = DEFAULT_DB_PATH) -> None:
             )
         """)
 
-        # Populate pricing data from defaults.py
+        # Populate pricing data from defaults.py, overwriting stored prices
+        # so edits to DEFAULT_MODEL_PRICING apply on the next start
         from src.config.defaults import DEFAULT_MODEL_PRICING
 
         timestamp = datetime.now(timezone.utc).isoformat()
-        for model_name, pricing_info in DEFAULT_MODEL_PRICING.items():
+        pricing_rows = _default_pricing_rows(DEFAULT_MODEL_PRICING, timestamp)
+
+        # Models whose stored prices differ from defaults.py (or that have no
+        # row yet); their records were costed with the old prices, or not at all
+        cursor.execute("""
+            SELECT model_name, input_price_per_mtok, output_price_per_mtok,
+                   cache_write_price_per_mtok, cache_read_price_per_mtok
+            FROM model_pricing
+        """)
+        stored_prices = {row[0]: tuple(row[1:]) for row in cursor.fetchall()}
+        changed_models = [
+            row[0] for row in pricing_rows
+            if stored_prices.get(row[0]) != tuple(row[1:5])
+        ]
+
+        cursor.executemany("""
+            INSERT OR REPLACE INTO model_pricing (
+                model_name, input_price_per_mtok, output_price_per_mtok,
+                cache_write_price_per_mtok, cache_read_price_per_mtok,
+                last_updated, notes
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, pricing_rows)
+
+        if backfill_cost:
+            cursor.execute(_SQL_RECOMPUTE_COST + " WHERE model IS NOT NULL")
+        elif changed_models:
+            placeholders = ",".join("?" * len(changed_models))
+            cursor.execute(
+                _SQL_RECOMPUTE_COST + f" WHERE model IN ({placeholders})",
+                changed_models,
+            )
+
+        # Per-model running totals of usage_records, kept current by triggers
+        # so get_database_stats() reads one row per model instead of
+        # aggregating the whole table
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'model_totals'"
+        )
+        create_model_totals = cursor.fetchone() is None
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS model_totals (
+                model TEXT PRIMARY KEY,
+                total_tokens INTEGER NOT NULL,
+                cost REAL NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_model_totals_insert
+            AFTER INSERT ON usage_records
+            WHEN NEW.model IS NOT NULL
+            BEGIN
+                INSERT INTO model_totals (model, total_tokens, cost)
+                VALUES (NEW.model, COALESCE(NEW.total_tokens, 0), COALESCE(NEW.cost, 0.0))
+                ON CONFLICT(model) DO UPDATE SET
+                    total_tokens = total_tokens + excluded.total_tokens,
+                    cost = cost + excluded.cost;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_model_totals_delete
+            AFTER DELETE ON usage_records
+            WHEN OLD.model IS NOT NULL
+            BEGIN
+                UPDATE model_totals
+                SET total_tokens = total_tokens - COALESCE(OLD.total_tokens, 0),
+                    cost = cost - COALESCE(OLD.cost, 0.0)
+                WHERE model = OLD.model;
+            END
+        """)
+        # Cost recomputes after pricing changes go through here
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_model_totals_update
+            AFTER UPDATE OF model, total_tokens, cost ON usage_records
+            BEGIN
+                UPDATE model_totals
+                SET total_tokens = total_tokens - COALESCE(OLD.total_tokens, 0),
+                    cost = cost - COALESCE(OLD.cost, 0.0)
+                WHERE model = OLD.model;
+                INSERT INTO model_totals (model, total_tokens, cost)
+                SELECT NEW.model, COALESCE(NEW.total_tokens, 0), COALESCE(NEW.cost, 0.0)
+                WHERE NEW.model IS NOT NULL
+                ON CONFLICT(model) DO UPDATE SET
+                    total_tokens = total_tokens + excluded.total_tokens,
+                    cost = cost + excluded.cost;
+            END
+        """)
+        if create_model_totals:
+            # Backfill from existing records (from scratch, so any trigger
+            # activity above during this transaction is superseded)
+            cursor.execute("DELETE FROM model_totals")
             cursor.execute("""
-                INSERT OR REPLACE INTO model_pricing (
-                    model_name, input_price_per_mtok, output_price_per_mtok,
-                    cache_write_price_per_mtok, cache_read_price_per_mtok,
-                    last_updated, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                model_name,
-                pricing_info['input_price'],
-                pricing_info['output_price'],
-                pricing_info['cache_write_price'],
-                pricing_info['cache_read_price'],
-                timestamp,
-                pricing_info.get('notes', '')
-            ))
+                INSERT INTO model_totals (model, total_tokens, cost)
+                SELECT model, COALESCE(SUM(total_tokens), 0), COALESCE(SUM(cost), 0.0)
+                FROM usage_records
+                WHERE model IS NOT NULL
+                GROUP BY model
+            """)
+
+        # Never lower the version (a newer build may have written it)
+        user_version = max(stored_version, _SCHEMA_VERSION)
+        cursor.execute(f"PRAGMA user_version = {user_version}")
 
         conn.commit()
     finally:
         conn.close()
 
+    return user_version
+
 
 def save_snapshot(records: list[UsageRecord], db_path: Path = DEFAULT_DB_PATH) -> int:
     """
@@ -1687,7 +2345,7 @@ def save_snapshot(records: list[UsageRecord], db_path: Path = DEFAULT_DB_PATH) -
 
     init_database(db_path)
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _get_rw_conn(db_path)
     saved_count = 0
 
     try:
@@ -1695,114 +2353,134 @@ def save_snapshot(records: list[UsageRecord], db_path: Path = DEFAULT_DB_PATH) -
         from src.config.user_config import get_machine_name
         machine_name = get_machine_name() or "Unknown"
 
-        # Save individual records (full mode only)
-        dates_to_update: set[str] = set()
+        # Take the write lock up front: this transaction reads (pricing, per-date
+        # totals) between writes, and a lazy DEFERRED -> RESERVED upgrade can fail
+        # with SQLITE_BUSY if another process writes in between
+        cursor.execute("BEGIN IMMEDIATE")
+
+        # Save individual records (full mode only). Records are inserted one
+        # executemany() per date: INSERT OR IGNORE skips existing rows in C,
+        # and cursor.rowcount (which, unlike conn.total_changes, excludes
+        # writes made by triggers) tells which dates actually gained rows.
+        records_by_date: dict[str, list[UsageRecord]] = defaultdict(list)
         for record in records:
-            # Get token values (0 for user messages without token_usage)
-            input_tokens = record.token_usage.input_tokens if record.token_usage else 0
-            output_tokens = record.token_usage.output_tokens if record.token_usage else 0
-            cache_creation_tokens = record.token_usage.cache_creation_tokens if record.token_usage else 0
-            cache_read_tokens = record.token_usage.cache_read_tokens if record.token_usage else 0
-            total_tokens = record.token_usage.total_tokens if record.token_usage else 0
-
-            # Calculate cost from model pricing table
-            cost = None
-            if record.model and record.token_usage:
-                cursor.execute("""
-                    SELECT input_price_per_mtok, output_price_per_mtok,
-                           cache_write_price_per_mtok, cache_read_price_per_mtok
-                    FROM model_pricing
-                    WHERE model_name = ?
-                """, (record.model,))
-                pricing_row = cursor.fetchone()
-
-                if pricing_row:
-                    input_price, output_price, cache_write_price, cache_read_price = pricing_row
-                    cost = (
-                        (input_tokens / 1_000_000) * input_price +
-                        (output_tokens / 1_000_000) * output_price +
-                        (cache_creation_tokens / 1_000_000) * cache_write_price +
-                        (cache_read_tokens / 1_000_000) * cache_read_price
-                    )
+            records_by_date[record.date_key].append(record)
 
-            try:
-                cursor.execute("""
-                    INSERT INTO usage_records (
-                        date, timestamp, session_id, message_uuid, message_type,
-                        model, folder, git_branch, version,
-                        input_tokens, output_tokens,
-                        cache_creation_tokens, cache_read_tokens, total_tokens,
-                        machine_name, content, cost
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    record.date_key,
-                    record.timestamp.isoformat(),
-                    record.session_id,
-                    record.message_uuid,
-                    record.message_type,
-                    record.model,
-                    record.folder,
-                    record.git_branch,
-                    record.version,
-                    input_tokens,
-                    output_tokens,
-                    cache_creation_tokens,
-                    cache_read_tokens,
-                    total_tokens,
-                    machine_name,
-                    record.content,  # Save content field
-                    cost,  # Save calculated cost
-                ))
-                saved_count += 1
-                dates_to_update.add(record.date_key)
-            except sqlite3.IntegrityError:
-                # Record already exists, skip it
-                pass
+        dates_to_update: set[str] = set()
+        for date_key, date_records in records_by_date.items():
+            # Cost is computed by SQLite from the model pricing table in the
+            # same statement (NULL for user messages and unpriced models).
+            # Named parameters, since the cost subquery reuses the token values.
+            cursor.executemany("""
+                INSERT OR IGNORE INTO usage_records (
+                    date, timestamp, session_id, message_uuid, message_type,
+                    model, folder, git_branch, version,
+                    input_tokens, output_tokens,
+                    cache_creation_tokens, cache_read_tokens, total_tokens,
+                    machine_name, content, cost, message_type_code
+                ) VALUES (
+                    :date, :timestamp, :session_id, :message_uuid, :message_type,
+                    :model, :folder, :git_branch, :version,
+                    :input_tokens, :output_tokens,
+                    :cache_creation_tokens, :cache_read_tokens, :total_tokens,
+                    :machine_name, :content, (
+                        SELECT
+                            (:input_tokens / 1000000.0) * input_price_per_mtok +
+                            (:output_tokens / 1000000.0) * output_price_per_mtok +
+                            (:cache_creation_tokens / 1000000.0) * cache_write_price_per_mtok +
+                            (:cache_read_tokens / 1000000.0) * cache_read_price_per_mtok
+                        FROM model_pricing
+                        WHERE model_name = :pricing_model
+                    ), :message_type_code
+                )
+            """, (
+                {
+                    "date": date_key,
+                    "timestamp": record.timestamp.isoformat(),
+                    "session_id": record.session_id,
+                    "message_uuid": record.message_uuid,
+                    "message_type": record.message_type,
+                    "model": record.model,
+                    "folder": record.folder,
+                    "git_branch": record.git_branch,
+                    "version": record.version,
+                    # Token values (0 for user messages without token_usage)
+                    "input_tokens": usage.input_tokens if usage else 0,
+                    "output_tokens": usage.output_tokens if usage else 0,
+                    "cache_creation_tokens": usage.cache_creation_tokens if usage else 0,
+                    "cache_read_tokens": usage.cache_read_tokens if usage else 0,
+                    "total_tokens": usage.total_tokens if usage else 0,
+                    "machine_name": machine_name,
+                    "content": record.content,  # Save content field
+                    "pricing_model": record.model if usage else None,  # Pricing lookup key
+                    "message_type_code": _MESSAGE_TYPE_CODES.get(
+                        record.message_type, _MESSAGE_TYPE_CODE_OTHER
+                    ),
+                }
+                for record in date_records
+                for usage in (record.token_usage,)
+            ))
+            inserted = cursor.rowcount
+            if inserted:
+                saved_count += inserted
+                dates_to_update.add(date_key)
 
         # Update daily snapshots only for dates touched by new records
         if dates_to_update:
             timestamp = datetime.now(timezone.utc).isoformat()
 
-            for date in sorted(dates_to_update):
-                # Calculate totals for this date from usage_records
-                cursor.execute("""
+            dates = sorted(dates_to_update)
+            snapshot_rows = []
+
+            # Calculate totals for all touched dates with one GROUP BY per batch
+            # (batched to stay under SQLite's bound-parameter limit). Rows come
+            # back already in daily_snapshots column order, NULLs coalesced.
+            for i in range(0, len(dates), _SQL_PARAM_BATCH_SIZE):
+                batch = dates[i:i + _SQL_PARAM_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(f"""
                     SELECT
-                        SUM(CASE WHEN message_type = 'user' THEN 1 ELSE 0 END) as total_prompts,
-                        SUM(CASE WHEN message_type = 'assistant' THEN 1 ELSE 0 END) as total_responses,
+                        date,
+                        SUM(CASE WHEN message_type_code = 0 THEN 1 ELSE 0 END) as total_prompts,
+                        SUM(CASE WHEN message_type_code = 1 THEN 1 ELSE 0 END) as total_responses,
                         COUNT(DISTINCT session_id) as total_sessions,
-                        SUM(total_tokens) as total_tokens,
-                        SUM(input_tokens) as input_tokens,
-                        SUM(output_tokens) as output_tokens,
-                        SUM(cache_creation_tokens) as cache_creation_tokens,
-                        SUM(cache_read_tokens) as cache_read_tokens
+                        COALESCE(SUM(total_tokens), 0) as total_tokens,
+                        COALESCE(SUM(input_tokens), 0) as input_tokens,
+                        COALESCE(SUM(output_tokens), 0) as output_tokens,
+                        COALESCE(SUM(cache_creation_tokens), 0) as cache_creation_tokens,
+                        COALESCE(SUM(cache_read_tokens), 0) as cache_read_tokens,
+                        ? as snapshot_timestamp
                     FROM usage_records
-                    WHERE date = ?
-                """, (date,))
-
-                row = cursor.fetchone()
-
-                # Use INSERT OR REPLACE only for dates that currently have data
-                # This preserves historical daily_snapshots for dates no longer in usage_records
-                cursor.execute("""
-                    INSERT OR REPLACE INTO daily_snapshots (
-                        date, total_prompts, total_responses, total_sessions, total_tokens,
-                        input_tokens, output_tokens, cache_creation_tokens,
-                        cache_read_tokens, snapshot_timestamp
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    date,
-                    row[0] or 0,
-                    row[1] or 0,
-                    row[2] or 0,
-                    row[3] or 0,
-                    row[4] or 0,
-                    row[5] or 0,
-                    row[6] or 0,
-                    row[7] or 0,
-                    timestamp,
-                ))
+                    WHERE date IN ({placeholders})
+                    GROUP BY date
+                """, (timestamp, *batch))
+
+                snapshot_rows.extend(cursor)
+
+            # Upsert only dates that currently have data. This preserves
+            # historical daily_snapshots for dates no longer in usage_records.
+            # The totals are full recomputes, so conflicts overwrite (not add);
+            # ON CONFLICT updates the row in place where REPLACE would delete
+            # and re-insert it.
+            cursor.executemany("""
+                INSERT INTO daily_snapshots (
+                    date, total_prompts, total_responses, total_sessions, total_tokens,
+                    input_tokens, output_tokens, cache_creation_tokens,
+                    cache_read_tokens, snapshot_timestamp
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(date) DO UPDATE SET
+                    total_prompts = excluded.total_prompts,
+                    total_responses = excluded.total_responses,
+                    total_sessions = excluded.total_sessions,
+                    total_tokens = excluded.total_tokens,
+                    input_tokens = excluded.input_tokens,
+                    output_tokens = excluded.output_tokens,
+                    cache_creation_tokens = excluded.cache_creation_tokens,
+                    cache_read_tokens = excluded.cache_read_tokens,
+                    snapshot_timestamp = excluded.snapshot_timestamp
+            """, snapshot_rows)
 
-        conn.commit()
+        cursor.execute("COMMIT")
 
         # Invalidate caches if new records were saved
         if saved_count > 0:
@@ -1828,7 +2506,7 @@ def save_snapshot(records: list[UsageRecord], db_path: Path = DEFAULT_DB_PATH) -
             should_update_global = True
 
     finally:
-        conn.close()
+        _release_rw_conn(conn)
 
     if should_update_global:
         try:
@@ -1865,15 +2543,19 @@ def save_limits_snapshot(
     """
     init_database(db_path)
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _get_rw_conn(db_path)
 
     try:
         cursor = conn.cursor()
+        # One clock read, so timestamp and date can't straddle midnight
         timestamp = datetime.now(timezone.utc).isoformat()
-        date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        date = timestamp[:10]
 
+        cursor.execute("BEGIN IMMEDIATE")
+        # timestamp has microsecond resolution, so a collision means this
+        # snapshot is already stored; IGNORE avoids REPLACE's delete + reinsert
         cursor.execute("""
-            INSERT OR REPLACE INTO limits_snapshots (
+            INSERT OR IGNORE INTO limits_snapshots (
                 timestamp, date, session_pct, week_pct, opus_pct,
                 session_reset, week_reset, opus_reset
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
@@ -1888,9 +2570,9 @@ def save_limits_snapshot(
             opus_reset,
         ))
 
-        conn.commit()
+        cursor.execute("COMMIT")
     finally:
-        conn.close()
+        _release_rw_conn(conn)
 
 
 def _get_current_device_name() -> str:
@@ -1927,7 +2609,7 @@ def load_records_after_timestamp(
     if not db_path.exists():
         return []
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _get_ro_conn(db_path)
 
     try:
         cursor = conn.cursor()
@@ -1958,8 +2640,8 @@ def load_records_after_timestamp(
                     cache_read_tokens=row[13],
                 )
 
-            record = UsageRecord(
-                timestamp=datetime.fromisoformat(row[2]),
+            record = UsageRecord.from_db_row(
+                timestamp=row[2],  # Parsed lazily on first .timestamp access
                 session_id=row[3],
                 message_uuid=row[4],
                 message_type=row[5],
@@ -1974,7 +2656,7 @@ def load_records_after_timestamp(
 
         return records
     finally:
-        conn.close()
+        _release_ro_conn(conn)
 
 
 def load_all_devices_historical_records_cached(
@@ -2284,112 +2966,80 @@ def load_historical_records(
     if not db_path.exists():
         return []
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _get_ro_conn(db_path)
 
     try:
-        cursor = conn.cursor()
-
-        # Try usage_records first (full mode)
-        query = "SELECT * FROM usage_records WHERE 1=1"
+        where = ""
         params = []
 
         if start_date:
-            query += " AND date >= ?"
+            where += " AND date >= ?"
             params.append(start_date)
 
         if end_date:
-            query += " AND date <= ?"
+            where += " AND date <= ?"
             params.append(end_date)
 
-        query += " ORDER BY date, timestamp"
-
-        cursor.execute(query, params)
+        # Try usage_records first (full mode), only the columns UsageRecord needs
+        cursor = conn.execute(f"""
+            SELECT
+                timestamp, session_id, message_uuid, message_type,
+                model, folder, git_branch, version,
+                input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens,
+                content
+            FROM usage_records
+            WHERE 1=1{where}
+            ORDER BY date, timestamp
+        """, params)
         rows = cursor.fetchall()
 
-        # If usage_records has data, use it
+        # If usage_records has data, use it. TokenUsage only exists if
+        # input_tokens or output_tokens are set (assistant messages). Cost is
+        # stored in the DB but not carried on UsageRecord.
         if rows:
-            records = []
-            for row in rows:
-                # Parse the row into a UsageRecord
-                # Row columns: id, date, timestamp, session_id, message_uuid, message_type,
-                #              model, folder, git_branch, version,
-                #              input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens, total_tokens,
-                #              machine_name, content, cost
-
-                # Only create TokenUsage if tokens exist (assistant messages)
-                token_usage = None
-                if row[10] > 0 or row[11] > 0:  # if input_tokens or output_tokens exist
-                    token_usage = TokenUsage(
-                        input_tokens=row[10],
-                        output_tokens=row[11],
-                        cache_creation_tokens=row[12],
-                        cache_read_tokens=row[13],
-                    )
-
-                record = UsageRecord(
-                    timestamp=datetime.fromisoformat(row[2]),
-                    session_id=row[3],
-                    message_uuid=row[4],
-                    message_type=row[5],
-                    model=row[6],
-                    folder=row[7],
-                    git_branch=row[8],
-                    version=row[9],
-                    token_usage=token_usage,
-                    content=row[16] if len(row) > 16 else None,  # Load content field
-                    # Note: cost (row[17]) is stored in DB but not used by UsageRecord class
-                    # Cost is calculated dynamically when needed for display
+            make_record = UsageRecord.from_db_row
+            make_usage = TokenUsage
+            return [
+                make_record(
+                    timestamp=row[0],  # Parsed lazily on first .timestamp access
+                    session_id=row[1],
+                    message_uuid=row[2],
+                    message_type=row[3],
+                    model=row[4],
+                    folder=row[5],
+                    git_branch=row[6],
+                    version=row[7],
+                    token_usage=make_usage(
+                        input_tokens=row[8],
+                        output_tokens=row[9],
+                        cache_creation_tokens=row[10],
+                        cache_read_tokens=row[11],
+                    ) if row[8] > 0 or row[9] > 0 else None,
+                    content=row[12],
                 )
-                records.append(record)
-
-            return records
+                for row in rows
+            ]
 
         # Fall back to daily_snapshots (aggregate mode from other PC)
-        query = "SELECT * FROM daily_snapshots WHERE 1=1"
-        params = []
-
-        if start_date:
-            query += " AND date >= ?"
-            params.append(start_date)
-
-        if end_date:
-            query += " AND date <= ?"
-            params.append(end_date)
-
-        query += " ORDER BY date"
-
-        cursor.execute(query, params)
-        snapshot_rows = cursor.fetchall()
-
-        if not snapshot_rows:
-            return []
+        cursor = conn.execute(f"""
+            SELECT date, total_responses, input_tokens, output_tokens,
+                   cache_creation_tokens, cache_read_tokens
+            FROM daily_snapshots
+            WHERE 1=1{where}
+            ORDER BY date
+        """, params)
 
-        # Convert daily_snapshots to synthetic UsageRecord objects
-        # Row columns: date, total_prompts, total_responses, total_sessions, total_tokens,
-        #              input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens, snapshot_timestamp
+        # Convert daily_snapshots to synthetic UsageRecord objects: one per day
+        # representing aggregated assistant responses
         records = []
-        for row in snapshot_rows:
-            date = row[0]
-            total_responses = row[2]
-            input_tokens = row[5]
-            output_tokens = row[6]
-            cache_creation_tokens = row[7]
-            cache_read_tokens = row[8]
-
-            # Create one synthetic record per day representing aggregated assistant responses
+        for (
+            date, total_responses, input_tokens, output_tokens,
+            cache_creation_tokens, cache_read_tokens,
+        ) in cursor:
             if total_responses > 0:
-                token_usage = TokenUsage(
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    cache_creation_tokens=cache_creation_tokens,
-                    cache_read_tokens=cache_read_tokens,
-                )
-
                 # Use date as both timestamp and session_id (aggregated data)
-                timestamp = datetime.fromisoformat(f"{date}T12:00:00+00:00")
-
-                record = UsageRecord(
-                    timestamp=timestamp,
+                records.append(UsageRecord(
+                    timestamp=datetime.fromisoformat(f"{date}T12:00:00+00:00"),
                     session_id=f"aggregated-{date}",
                     message_uuid=f"aggregated-{date}",
                     message_type="assistant",
@@ -2397,99 +3047,122 @@ def load_historical_records(
                     folder="unknown",
                     git_branch=None,
                     version="unknown",
-                    token_usage=token_usage,
-                )
-                records.append(record)
-
+                    token_usage=TokenUsage(
+                        input_tokens=input_tokens,
+                        output_tokens=output_tokens,
+                        cache_creation_tokens=cache_creation_tokens,
+                        cache_read_tokens=cache_read_tokens,
+                    ),
+                ))
         return records
     finally:
-        conn.close()
-
+        _release_ro_conn(conn)
 
 
 def get_text_analysis_stats(db_path: Path = DEFAULT_DB_PATH) -> dict:
     """
-    Analyze message content from JSONL files for text statistics.
+    Analyze stored message content for text statistics.
+
+    Streams usage_records.content and scans each message once for every
+    text_analysis category. Results are cached for 60 seconds per database
+    file and recomputed as soon as the file changes on disk.
+
+    Args:
+        db_path: Path to the SQLite database file
 
     Returns:
         Dictionary with text analysis statistics
     """
-    from src.config.settings import get_claude_jsonl_files
-    from src.data.jsonl_parser import parse_all_jsonl_files
-    from src.utils.text_analysis import (
-        count_swears,
-        count_perfect_phrases,
-        count_absolutely_right_phrases,
-        count_thank_phrases,
-        count_please_phrases,
-    )
+    global _text_stats_cache, _text_stats_cache_key, _text_stats_cache_time
+    import time
+    from src.utils.text_analysis import ASSISTANT_CATEGORIES, USER_CATEGORIES, count_all
+
+    empty_stats = {
+        "user_swears": 0,
+        "assistant_swears": 0,
+        "perfect_count": 0,
+        "absolutely_right_count": 0,
+        "user_thanks": 0,
+        "user_please": 0,
+        "avg_user_prompt_chars": 0,
+        "total_user_chars": 0,
+    }
 
     try:
-        # Get current JSONL files
-        jsonl_files = get_claude_jsonl_files()
-        if not jsonl_files:
-            return {
-                "user_swears": 0,
-                "assistant_swears": 0,
-                "perfect_count": 0,
-                "absolutely_right_count": 0,
-                "user_thanks": 0,
-                "user_please": 0,
-                "avg_user_prompt_chars": 0,
-                "total_user_chars": 0,
-            }
+        stat = db_path.stat()
+    except OSError:
+        return empty_stats
 
-        # Parse all records
-        records = parse_all_jsonl_files(jsonl_files)
+    # Any committed write rewrites the DB file (DELETE journal mode),
+    # so mtime + size identify the data the cached result was computed from
+    cache_key = (str(db_path), stat.st_mtime_ns, stat.st_size)
+    current_time = time.time()
+    if (
+        _text_stats_cache is not None
+        and _text_stats_cache_key == cache_key
+        and current_time - _text_stats_cache_time < _CACHE_EXPIRY_SECONDS
+    ):
+        return _text_stats_cache
+
+    user_swears = 0
+    assistant_swears = 0
+    perfect_count = 0
+    absolutely_right_count = 0
+    user_thanks = 0
+    user_please = 0
+    total_user_chars = 0
+    user_prompt_count = 0
 
-        user_swears = 0
-        assistant_swears = 0
-        perfect_count = 0
-        absolutely_right_count = 0
-        user_thanks = 0
-        user_please = 0
-        total_user_chars = 0
-        user_prompt_count = 0
+    try:
+        conn = _get_ro_conn(db_path)
+        try:
+            rows = conn.execute("""
+                SELECT message_type, content
+                FROM usage_records
+                WHERE content IS NOT NULL AND content != ''
+                  AND message_type IN ('user', 'assistant')
+            """)
 
-        for record in records:
-            if not record.content:
-                continue
+            # One scan per message, over only the categories its role reports
+            for message_type, content in rows:
+                if message_type == "user":
+                    counts = count_all(content, USER_CATEGORIES)
+                    user_swears += counts["swears"]
+                    user_thanks += counts["thanks"]
+                    user_please += counts["please"]
+                    total_user_chars += len(content)
+                    user_prompt_count += 1
+                else:
+                    counts = count_all(content, ASSISTANT_CATEGORIES)
+                    assistant_swears += counts["swears"]
+                    perfect_count += counts["perfect"]
+                    absolutely_right_count += counts["absolutely_right"]
+        finally:
+            _release_ro_conn(conn)
+    except sqlite3.Error:
+        # Return zeros if analysis fails
+        return empty_stats
 
-            if record.is_user_prompt:
-                user_swears += count_swears(record.content)
-                user_thanks += count_thank_phrases(record.content)
-                user_please += count_please_phrases(record.content)
-                total_user_chars += record.char_count
-                user_prompt_count += 1
-            elif record.is_assistant_response:
-                assistant_swears += count_swears(record.content)
-                perfect_count += count_perfect_phrases(record.content)
-                absolutely_right_count += count_absolutely_right_phrases(record.content)
+    avg_user_prompt_chars = total_user_chars / user_prompt_count if user_prompt_count > 0 else 0
+
+    result = {
+        "user_swears": user_swears,
+        "assistant_swears": assistant_swears,
+        "perfect_count": perfect_count,
+        "absolutely_right_count": absolutely_right_count,
+        "user_thanks": user_thanks,
+        "user_please": user_please,
+        "avg_user_prompt_chars": round(avg_user_prompt_chars),
+        "total_user_chars": total_user_chars,
+    }
+
+    _text_stats_cache = result
+    _text_stats_cache_key = cache_key
+    _text_stats_cache_time = current_time
+
+    return result
 
-        avg_user_prompt_chars = total_user_chars / user_prompt_count if user_prompt_count > 0 else 0
 
-        return {
-            "user_swears": user_swears,
-            "assistant_swears": assistant_swears,
-            "perfect_count": perfect_count,
-            "absolutely_right_count": absolutely_right_count,
-            "user_thanks": user_thanks,
-            "user_please": user_please,
-            "avg_user_prompt_chars": round(avg_user_prompt_chars),
-            "total_user_chars": total_user_chars,
-        }
-    except Exception:
-        # Return zeros if analysis fails
-        return {
-            "user_swears": 0,
-            "assistant_swears": 0,
-            "perfect_count": 0,
-            "absolutely_right_count": 0,
-            "user_thanks": 0,
-            "user_please": 0,
-            "avg_user_prompt_chars": 0,
-            "total_user_chars": 0,
-        }
 def get_limits_data(db_path: Path = DEFAULT_DB_PATH) -> dict[str, dict[str, int]]:
     """
     Get daily maximum limits percentages from the database.
@@ -2509,13 +3182,11 @@ def get_limits_data(db_path: Path = DEFAULT_DB_PATH) -> dict[str, dict[str, int]
     if not db_path.exists():
         return {}
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _get_ro_conn(db_path)
 
     try:
-        cursor = conn.cursor()
-
-        # Get max week_pct and opus_pct per day
-        cursor.execute("""
+        # Get max week_pct and opus_pct per day, built straight from the cursor
+        rows = conn.execute("""
             SELECT
                 date,
                 MAX(week_pct) as max_week,
@@ -2526,14 +3197,14 @@ def get_limits_data(db_path: Path = DEFAULT_DB_PATH) -> dict[str, dict[str, int]
         """)
 
         return {
-            row[0]: {
-                "week_pct": row[1] or 0,
-                "opus_pct": row[2] or 0
+            date: {
+                "week_pct": max_week or 0,
+                "opus_pct": max_opus or 0
             }
-            for row in cursor.fetchall()
+            for date, max_week, max_opus in rows
         }
     finally:
-        conn.close()
+        _release_ro_conn(conn)
 
 
 def get_latest_limits(db_path: Path = DEFAULT_DB_PATH) -> dict | None:
@@ -2559,7 +3230,7 @@ def get_latest_limits(db_path: Path = DEFAULT_DB_PATH) -> dict | None:
     if not db_path.exists():
         return None
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _get_ro_conn(db_path)
 
     try:
         cursor = conn.cursor()
@@ -2586,7 +3257,7 @@ def get_latest_limits(db_path: Path = DEFAULT_DB_PATH) -> dict | None:
             "opus_reset": row[5] or "",
         }
     finally:
-        conn.close()
+        _release_ro_conn(conn)
 
 
 def update_monthly_device_stats(db_path: Path = DEFAULT_DB_PATH) -> None:
@@ -2610,7 +3281,7 @@ def update_monthly_device_stats(db_path: Path = DEFAULT_DB_PATH) -> None:
     # Ensure database schema is up to date (creates device_monthly_stats table if needed)
     init_database(db_path)
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _open_conn(db_path)
 
     try:
         cursor = conn.cursor()
@@ -2620,83 +3291,59 @@ def update_monthly_device_stats(db_path: Path = DEFAULT_DB_PATH) -> None:
         machine_name = get_machine_name() or "Unknown"
         current_month = dt.now(timezone.utc).strftime("%Y-%m")
 
-        # Get all distinct year-months from usage_records (excluding current month)
+        # Aggregate every completed month that isn't stored yet in one pass
+        # (one GROUP BY instead of existence check + totals + cost per month).
+        # Prices aren't COALESCEd: records without a priced model add nothing.
+        # message_type_code is safe to use here: init_database() above has
+        # migrated this file.
         cursor.execute("""
-            SELECT DISTINCT substr(date, 1, 7) as year_month
-            FROM usage_records
-            WHERE substr(date, 1, 7) < ?
+            SELECT
+                substr(ur.date, 1, 7) as year_month,
+                COUNT(*) as total_records,
+                COUNT(DISTINCT ur.session_id) as total_sessions,
+                COUNT(CASE WHEN ur.message_type_code = 1 THEN 1 END) as total_messages,
+                COALESCE(SUM(ur.total_tokens), 0) as total_tokens,
+                COALESCE(SUM(ur.input_tokens), 0) as input_tokens,
+                COALESCE(SUM(ur.output_tokens), 0) as output_tokens,
+                COALESCE(SUM(ur.cache_creation_tokens), 0) as cache_creation_tokens,
+                COALESCE(SUM(ur.cache_read_tokens), 0) as cache_read_tokens,
+                COALESCE(SUM(
+                    (ur.input_tokens / 1000000.0) * mp.input_price_per_mtok +
+                    (ur.output_tokens / 1000000.0) * mp.output_price_per_mtok +
+                    (ur.cache_creation_tokens / 1000000.0) * mp.cache_write_price_per_mtok +
+                    (ur.cache_read_tokens / 1000000.0) * mp.cache_read_price_per_mtok
+                ), 0.0) as total_cost,
+                MIN(ur.date) as oldest_date,
+                MAX(ur.date) as newest_date
+            FROM usage_records ur
+            LEFT JOIN model_pricing mp ON ur.model = mp.model_name
+            WHERE ur.date < ?
+              AND substr(ur.date, 1, 7) NOT IN (
+                  SELECT year_month FROM device_monthly_stats WHERE machine_name = ?
+              )
+            GROUP BY year_month
             ORDER BY year_month
-        """, (current_month,))
-
-        months = [row[0] for row in cursor.fetchall()]
-
-        for year_month in months:
-            # Check if this month is already aggregated
-            cursor.execute("""
-                SELECT last_updated FROM device_monthly_stats
-                WHERE machine_name = ? AND year_month = ?
-            """, (machine_name, year_month))
-
-            existing = cursor.fetchone()
-
-            # Skip if already aggregated and records haven't changed
-            # (We could add more sophisticated change detection here)
-            if existing:
-                continue
-
-            # Aggregate statistics for this month
-            cursor.execute("""
-                SELECT
-                    COUNT(*) as total_records,
-                    COUNT(DISTINCT session_id) as total_sessions,
-                    COUNT(CASE WHEN message_type = 'assistant' THEN 1 END) as total_messages,
-                    COALESCE(SUM(total_tokens), 0) as total_tokens,
-                    COALESCE(SUM(input_tokens), 0) as input_tokens,
-                    COALESCE(SUM(output_tokens), 0) as output_tokens,
-                    COALESCE(SUM(cache_creation_tokens), 0) as cache_creation_tokens,
-                    COALESCE(SUM(cache_read_tokens), 0) as cache_read_tokens,
-                    MIN(date) as oldest_date,
-                    MAX(date) as newest_date
-                FROM usage_records
-                WHERE substr(date, 1, 7) = ?
-            """, (year_month,))
-
-            row = cursor.fetchone()
-            if not row or (row[0] or 0) == 0:
-                continue
-
-            # Calculate cost for this month
-            cursor.execute("""
-                SELECT
-                    COALESCE(SUM(
-                        (ur.input_tokens / 1000000.0) * mp.input_price_per_mtok +
-                        (ur.output_tokens / 1000000.0) * mp.output_price_per_mtok +
-                        (ur.cache_creation_tokens / 1000000.0) * mp.cache_write_price_per_mtok +
-                        (ur.cache_read_tokens / 1000000.0) * mp.cache_read_price_per_mtok
-                    ), 0.0) as total_cost
-                FROM usage_records ur
-                LEFT JOIN model_pricing mp ON ur.model = mp.model_name
-                WHERE substr(ur.date, 1, 7) = ? AND ur.model IS NOT NULL
-            """, (year_month,))
+        """, (f"{current_month}-01", machine_name))
 
-            cost_row = cursor.fetchone()
-            total_cost = round(cost_row[0], 2) if cost_row else 0.0
+        timestamp = dt.now(timezone.utc).isoformat()
+        monthly_rows = [
+            (
+                machine_name, row[0],
+                row[1], row[2], row[3], row[4],
+                row[5], row[6], row[7], row[8],
+                round(row[9], 2), row[10], row[11], timestamp
+            )
+            for row in cursor
+        ]
 
-            # Insert or replace monthly stats
-            timestamp = dt.now(timezone.utc).isoformat()
-            cursor.execute("""
-                INSERT OR REPLACE INTO device_monthly_stats (
-                    machine_name, year_month,
-                    total_records, total_sessions, total_messages, total_tokens,
-                    input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens,
-                    total_cost, oldest_date, newest_date, last_updated
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        cursor.executemany("""
+            INSERT OR REPLACE INTO device_monthly_stats (
                 machine_name, year_month,
-                row[0], row[1], row[2], row[3],
-                row[4], row[5], row[6], row[7],
-                total_cost, row[8], row[9], timestamp
-            ))
+                total_records, total_sessions, total_messages, total_tokens,
+                input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens,
+                total_cost, oldest_date, newest_date, last_updated
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, monthly_rows)
 
         conn.commit()
     finally:
@@ -2772,72 +3419,13 @@ def get_device_statistics(db_path: Path = DEFAULT_DB_PATH, force_refresh: bool =
         if not machine_db.exists():
             continue
 
-        # Open separate connection for each DB with optimized settings
-        conn = sqlite3.connect(machine_db, timeout=30.0)
+        # Open separate read-only connection for each DB
+        conn = _get_ro_conn(machine_db)
 
         try:
-            cursor = conn.cursor()
-
-            # Optimize read-only queries (no need for journaling/sync overhead)
-            cursor.execute("PRAGMA query_only = ON")
-
             # Single combined query - get ALL data in one shot
             # This eliminates multiple round-trips to the database
-            cursor.execute("""
-                WITH monthly_agg AS (
-                    SELECT
-                        COALESCE(SUM(total_records), 0) as total_records,
-                        COALESCE(SUM(total_sessions), 0) as total_sessions,
-                        COALESCE(SUM(total_messages), 0) as total_messages,
-                        COALESCE(SUM(total_tokens), 0) as total_tokens,
-                        COALESCE(SUM(input_tokens), 0) as input_tokens,
-                        COALESCE(SUM(output_tokens), 0) as output_tokens,
-                        COALESCE(SUM(cache_creation_tokens), 0) as cache_creation_tokens,
-                        COALESCE(SUM(cache_read_tokens), 0) as cache_read_tokens,
-                        COALESCE(SUM(total_cost), 0.0) as total_cost,
-                        MIN(oldest_date) as oldest_date,
-                        MAX(newest_date) as newest_date
-                    FROM device_monthly_stats
-                    WHERE machine_name = ?
-                ),
-                current_month_agg AS (
-                    SELECT
-                        COUNT(*) as total_records,
-                        COUNT(DISTINCT session_id) as total_sessions,
-                        COUNT(CASE WHEN message_type = 'assistant' THEN 1 END) as total_messages,
-                        COALESCE(SUM(ur.total_tokens), 0) as total_tokens,
-                        COALESCE(SUM(ur.input_tokens), 0) as input_tokens,
-                        COALESCE(SUM(ur.output_tokens), 0) as output_tokens,
-                        COALESCE(SUM(ur.cache_creation_tokens), 0) as cache_creation_tokens,
-                        COALESCE(SUM(ur.cache_read_tokens), 0) as cache_read_tokens,
-                        MIN(ur.date) as oldest_date,
-                        MAX(ur.date) as newest_date,
-                        COALESCE(SUM(
-                            (ur.input_tokens / 1000000.0) * COALESCE(mp.input_price_per_mtok, 0) +
-                            (ur.output_tokens / 1000000.0) * COALESCE(mp.output_price_per_mtok, 0) +
-                            (ur.cache_creation_tokens / 1000000.0) * COALESCE(mp.cache_write_price_per_mtok, 0) +
-                            (ur.cache_read_tokens / 1000000.0) * COALESCE(mp.cache_read_price_per_mtok, 0)
-                        ), 0.0) as total_cost
-                    FROM usage_records ur
-                    LEFT JOIN model_pricing mp ON ur.model = mp.model_name
-                    WHERE substr(ur.date, 1, 7) = ?
-                )
-                SELECT
-                    m.total_records + c.total_records as total_records,
-                    m.total_sessions + c.total_sessions as total_sessions,
-                    m.total_messages + c.total_messages as total_messages,
-                    m.total_tokens + c.total_tokens as total_tokens,
-                    m.input_tokens + c.input_tokens as input_tokens,
-                    m.output_tokens + c.output_tokens as output_tokens,
-                    m.cache_creation_tokens + c.cache_creation_tokens as cache_creation_tokens,
-                    m.cache_read_tokens + c.cache_read_tokens as cache_read_tokens,
-                    m.total_cost + c.total_cost as total_cost,
-                    MIN(m.oldest_date, c.oldest_date) as oldest_date,
-                    MAX(m.newest_date, c.newest_date) as newest_date
-                FROM monthly_agg m, current_month_agg c
-            """, (machine_name, current_month))
-
-            row = cursor.fetchone()
+            row = conn.execute(_SQL_DEVICE_STATS, (machine_name, current_month)).fetchone()
 
             # Check if device has any data
             if row and (row[0] or 0) > 0:
@@ -2857,16 +3445,16 @@ def get_device_statistics(db_path: Path = DEFAULT_DB_PATH, force_refresh: bool =
                 }
 
         finally:
-            conn.close()
+            _release_ro_conn(conn)
 
     if not device_stats:
         _device_stats_cache = []
         _device_stats_cache_time = current_time
         return []
 
-    # Sort by tokens and return
-    results = list(device_stats.values())
-    results.sort(key=lambda x: x["total_tokens"], reverse=True)
+    # Sort by tokens and return. Each device lives in its own DB file, so
+    # the ordering cannot be pushed into a single SQL ORDER BY.
+    results = sorted(device_stats.values(), key=itemgetter("total_tokens"), reverse=True)
 
     # Update cache
     _device_stats_cache = results
@@ -2923,11 +3511,10 @@ def get_device_statistics_for_period(period: str = "all") -> list[dict]:
         if not machine_db.exists():
             continue
 
-        conn = sqlite3.connect(machine_db, timeout=30.0)
+        conn = _open_conn(machine_db, readonly=True)
 
         try:
             cursor = conn.cursor()
-            cursor.execute("PRAGMA query_only = ON")
 
             # Query only for the specified date range
             cursor.execute("""
@@ -2942,14 +3529,8 @@ def get_device_statistics_for_period(period: str = "all") -> list[dict]:
                     COALESCE(SUM(ur.cache_read_tokens), 0) as cache_read_tokens,
                     MIN(ur.date) as oldest_date,
                     MAX(ur.date) as newest_date,
-                    COALESCE(SUM(
-                        (ur.input_tokens / 1000000.0) * COALESCE(mp.input_price_per_mtok, 0) +
-                        (ur.output_tokens / 1000000.0) * COALESCE(mp.output_price_per_mtok, 0) +
-                        (ur.cache_creation_tokens / 1000000.0) * COALESCE(mp.cache_write_price_per_mtok, 0) +
-                        (ur.cache_read_tokens / 1000000.0) * COALESCE(mp.cache_read_price_per_mtok, 0)
-                    ), 0.0) as total_cost
+                    COALESCE(SUM(ur.cost), 0.0) as total_cost
                 FROM usage_records ur
-                LEFT JOIN model_pricing mp ON ur.model = mp.model_name
                 WHERE ur.date >= ? AND ur.date <= ?
             """, (start_date, end_date))
 
@@ -2978,9 +3559,9 @@ def get_device_statistics_for_period(period: str = "all") -> list[dict]:
     if not device_stats:
         return []
 
-    # Sort by tokens and return
-    results = list(device_stats.values())
-    results.sort(key=lambda x: x["total_tokens"], reverse=True)
+    # Sort by tokens and return. Each device lives in its own DB file, so
+    # the ordering cannot be pushed into a single SQL ORDER BY.
+    results = sorted(device_stats.values(), key=itemgetter("total_tokens"), reverse=True)
 
     return results
 
@@ -2999,7 +3580,7 @@ def save_user_preference(key: str, value: str, db_path: Path = DEFAULT_DB_PATH)
     """
     init_database(db_path)
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _open_conn(db_path)
 
     try:
         cursor = conn.cursor()
@@ -3014,6 +3595,8 @@ def save_user_preference(key: str, value: str, db_path: Path = DEFAULT_DB_PATH)
     finally:
         conn.close()
 
+    clear_timezone_cache()
+
 
 def load_user_preferences(db_path: Path = DEFAULT_DB_PATH) -> dict:
     """
@@ -3034,32 +3617,37 @@ def load_user_preferences(db_path: Path = DEFAULT_DB_PATH) -> dict:
     if not db_path.exists():
         return defaults
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _get_ro_conn(db_path)
 
     try:
-        cursor = conn.cursor()
-
-        # Ensure user_preferences table exists (migration for existing DBs)
-        try:
-            cursor.execute("SELECT key, value FROM user_preferences")
-            rows = cursor.fetchall()
-        except sqlite3.OperationalError:
-            # Table doesn't exist, initialize database to create it
-            conn.close()
-            init_database(db_path)
-            conn = sqlite3.connect(db_path, timeout=30.0)
+        if db_path in _prefs_table_verified:
+            # Table known to exist - skip the migration fallback
+            rows = conn.execute("SELECT key, value FROM user_preferences").fetchall()
+        else:
             cursor = conn.cursor()
-            cursor.execute("SELECT key, value FROM user_preferences")
-            rows = cursor.fetchall()
 
-        # Merge DB values with defaults
-        prefs = defaults.copy()
-        for key, value in rows:
-            prefs[key] = value
+            # Ensure user_preferences table exists (migration for existing DBs)
+            try:
+                cursor.execute("SELECT key, value FROM user_preferences")
+                rows = cursor.fetchall()
+            except sqlite3.OperationalError:
+                # Table doesn't exist, initialize database to create it
+                _release_ro_conn(conn)
+                init_database(db_path)
+                conn = _get_ro_conn(db_path)
+                cursor = conn.cursor()
+                cursor.execute("SELECT key, value FROM user_preferences")
+                rows = cursor.fetchall()
+            _prefs_table_verified.add(db_path)
+
+        # Merge DB values over defaults (get_all_defaults() returns a fresh
+        # dict, so it can be updated in place). Stored keys without a default
+        # are kept, which a defaults-driven SQL COALESCE would drop.
+        defaults.update(rows)
 
-        return prefs
+        return defaults
     finally:
-        conn.close()
+        _release_ro_conn(conn)
 
 
 def save_all_preferences(prefs: dict, db_path: Path = DEFAULT_DB_PATH) -> None:
@@ -3075,22 +3663,24 @@ def save_all_preferences(prefs: dict, db_path: Path = DEFAULT_DB_PATH) -> None:
     """
     init_database(db_path)
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _open_conn(db_path)
 
     try:
         cursor = conn.cursor()
         timestamp = datetime.now(timezone.utc).isoformat()
 
-        for key, value in prefs.items():
-            cursor.execute("""
-                INSERT OR REPLACE INTO user_preferences (key, value, updated_at)
-                VALUES (?, ?, ?)
-            """, (key, value, timestamp))
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany("""
+            INSERT OR REPLACE INTO user_preferences (key, value, updated_at)
+            VALUES (?, ?, ?)
+        """, [(key, value, timestamp) for key, value in prefs.items()])
 
-        conn.commit()
+        cursor.execute("COMMIT")
     finally:
         conn.close()
 
+    clear_timezone_cache()
+
 
 def delete_user_preference(key: str, db_path: Path = DEFAULT_DB_PATH) -> None:
     """
@@ -3107,7 +3697,7 @@ def delete_user_preference(key: str, db_path: Path = DEFAULT_DB_PATH) -> None:
     """
     init_database(db_path)
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _open_conn(db_path)
 
     try:
         cursor = conn.cursor()
@@ -3116,6 +3706,8 @@ def delete_user_preference(key: str, db_path: Path = DEFAULT_DB_PATH) -> None:
     finally:
         conn.close()
 
+    clear_timezone_cache()
+
 
 def delete_user_preferences(db_path: Path = DEFAULT_DB_PATH) -> None:
     """
@@ -3133,7 +3725,7 @@ def delete_user_preferences(db_path: Path = DEFAULT_DB_PATH) -> None:
     """
     init_database(db_path)
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _open_conn(db_path)
 
     try:
         cursor = conn.cursor()
@@ -3142,6 +3734,8 @@ def delete_user_preferences(db_path: Path = DEFAULT_DB_PATH) -> None:
     finally:
         conn.close()
 
+    clear_timezone_cache()
+
 
 def load_all_devices_messages_by_hour(
     target_date: str,
@@ -3182,6 +3776,35 @@ def load_all_devices_messages_by_hour(
     return all_messages
 
 
+@lru_cache(maxsize=8)
+def _resolve_named_tz(user_tz: str) -> ZoneInfo:
+    """
+    Resolve a timezone preference ("UTC" or an IANA name) to a ZoneInfo.
+
+    Args:
+        user_tz: Timezone preference value other than "auto"
+
+    Returns:
+        ZoneInfo for the timezone
+    """
+    return ZoneInfo(user_tz)
+
+
+def _resolve_tz(user_tz: str):
+    """
+    Resolve the user's timezone preference to a tzinfo.
+
+    Args:
+        user_tz: Timezone preference ("auto", "UTC" or an IANA name)
+
+    Returns:
+        tzinfo for the preference ("auto" resolves to the system timezone)
+    """
+    if user_tz == "auto":
+        return datetime.now().astimezone().tzinfo
+    return _resolve_named_tz(user_tz)
+
+
 def load_messages_by_hour(
     target_date: str,
     target_hour: int,
@@ -3204,32 +3827,19 @@ def load_messages_by_hour(
     if not db_path.exists():
         return []
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _get_ro_conn(db_path)
 
     try:
         cursor = conn.cursor()
 
         # Query messages from the target hour
         # Note: timestamps are stored in UTC, need to filter correctly
-        from src.utils.timezone import get_user_timezone
-        from datetime import datetime as dt
-        from zoneinfo import ZoneInfo
-
-        user_tz = get_user_timezone()
-
         # Create hour range in user's timezone, then convert to UTC for query
         # Target: 2025-10-15 23:00 to 23:59:59 in user's local time
-        if user_tz == "UTC":
-            tz_obj = ZoneInfo("UTC")
-        elif user_tz == "auto":
-            # Get system timezone
-            import time
-            tz_obj = dt.now().astimezone().tzinfo
-        else:
-            tz_obj = ZoneInfo(user_tz)
+        tz_obj = _resolve_tz(get_user_timezone())
 
         # Create start and end times in user's timezone
-        start_local = dt(
+        start_local = datetime(
             int(target_date[:4]),
             int(target_date[5:7]),
             int(target_date[8:10]),
@@ -3238,7 +3848,7 @@ def load_messages_by_hour(
             0,
             tzinfo=tz_obj
         )
-        end_local = dt(
+        end_local = datetime(
             int(target_date[:4]),
             int(target_date[5:7]),
             int(target_date[8:10]),
@@ -3248,58 +3858,49 @@ def load_messages_by_hour(
             tzinfo=tz_obj
         )
 
-        # Convert to UTC for database query
-        start_utc = start_local.astimezone(ZoneInfo("UTC"))
-        end_utc = end_local.astimezone(ZoneInfo("UTC"))
+        # Convert to UTC for database query (timezone.utc is a fixed offset,
+        # so this is plain arithmetic with no tz database lookup)
+        start_utc = start_local.astimezone(timezone.utc)
+        end_utc = end_local.astimezone(timezone.utc)
 
-        # Query with UTC timestamps
+        # Query with UTC timestamps (only the columns UsageRecord needs)
         cursor.execute("""
-            SELECT * FROM usage_records
+            SELECT
+                timestamp, session_id, message_uuid, message_type,
+                model, folder, git_branch, version,
+                input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens,
+                content
+            FROM usage_records
             WHERE timestamp >= ? AND timestamp <= ?
             ORDER BY timestamp ASC
         """, (start_utc.isoformat(), end_utc.isoformat()))
 
-        rows = cursor.fetchall()
-
-        if not rows:
-            return []
-
-        # Convert rows to UsageRecord objects
-        records = []
-        for row in rows:
-            # Row columns: id, date, timestamp, session_id, message_uuid, message_type,
-            #              model, folder, git_branch, version,
-            #              input_tokens, output_tokens, cache_creation_tokens, cache_read_tokens, total_tokens,
-            #              machine_name, content, cost
-
-            # Only create TokenUsage if tokens exist (assistant messages)
-            token_usage = None
-            if row[10] > 0 or row[11] > 0:  # if input_tokens or output_tokens exist
-                token_usage = TokenUsage(
-                    input_tokens=row[10],
-                    output_tokens=row[11],
-                    cache_creation_tokens=row[12],
-                    cache_read_tokens=row[13],
-                )
-
-            record = UsageRecord(
-                timestamp=dt.fromisoformat(row[2]),
-                session_id=row[3],
-                message_uuid=row[4],
-                message_type=row[5],
-                model=row[6],
-                folder=row[7],
-                git_branch=row[8],
-                version=row[9],
-                token_usage=token_usage,
-                content=row[16] if len(row) > 16 else None,  # Load content field
-                # Note: cost (row[17]) is stored in DB but not used by UsageRecord class
+        # Convert rows to UsageRecord objects. TokenUsage only exists if
+        # input_tokens or output_tokens are set (assistant messages).
+        make_record = UsageRecord.from_db_row
+        make_usage = TokenUsage
+        return [
+            make_record(
+                timestamp=row[0],  # Parsed lazily on first .timestamp access
+                session_id=row[1],
+                message_uuid=row[2],
+                message_type=row[3],
+                model=row[4],
+                folder=row[5],
+                git_branch=row[6],
+                version=row[7],
+                token_usage=make_usage(
+                    input_tokens=row[8],
+                    output_tokens=row[9],
+                    cache_creation_tokens=row[10],
+                    cache_read_tokens=row[11],
+                ) if row[8] > 0 or row[9] > 0 else None,
+                content=row[12],
             )
-            records.append(record)
-
-        return records
+            for row in cursor
+        ]
     finally:
-        conn.close()
+        _release_ro_conn(conn)
 
 
 def get_database_stats(db_path: Path = DEFAULT_DB_PATH) -> dict:
@@ -3349,75 +3950,54 @@ def get_database_stats(db_path: Path = DEFAULT_DB_PATH) -> dict:
             "avg_cost_per_response": 0.0,
         }
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _get_ro_conn(db_path)
 
     try:
-        cursor = conn.cursor()
-
-        # Basic counts (single scan)
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total_records,
-                COUNT(DISTINCT date) as total_days,
-                MIN(date) as oldest_date,
-                MAX(date) as newest_date
-            FROM usage_records
-        """)
-        row = cursor.fetchone()
+        # Basic counts from usage_records and totals from daily_snapshots
+        # (one statement, one scan of each table). Statements go through
+        # conn.execute() with module-level SQL so the cached connection's
+        # statement cache skips re-preparing them on later refreshes.
+        row = conn.execute(_SQL_DATABASE_TOTALS).fetchone()
         total_records = row[0] or 0
         total_days = row[1] or 0
         oldest_date = row[2]
         newest_date = row[3]
-
-        # Get newest snapshot timestamp
-        cursor.execute("SELECT MAX(snapshot_timestamp) FROM daily_snapshots")
-        newest_timestamp = cursor.fetchone()[0]
-
-        # Aggregate statistics from daily_snapshots
-        cursor.execute("""
-            SELECT
-                SUM(total_tokens) as total_tokens,
-                SUM(total_prompts) as total_prompts,
-                SUM(total_responses) as total_responses,
-                SUM(total_sessions) as total_sessions
-            FROM daily_snapshots
-        """)
-        row = cursor.fetchone()
-        total_tokens = row[0] or 0
-        total_prompts = row[1] or 0
-        total_responses = row[2] or 0
-        total_sessions = row[3] or 0
-
-        # Tokens by model (only available if usage_records exist)
+        newest_timestamp = row[4]
+        total_tokens = row[5] or 0
+        total_prompts = row[6] or 0
+        total_responses = row[7] or 0
+        total_sessions = row[8] or 0
+
+        # daily_snapshots not built yet (e.g. records imported by an older
+        # version): derive the totals from usage_records instead of
+        # reporting zero. SUM() over an empty table is NULL, so this only
+        # runs when daily_snapshots has no rows at all.
+        if total_records > 0 and row[5] is None:
+            fallback = conn.execute(_SQL_USAGE_TOTALS).fetchone()
+            total_tokens = fallback[0] or 0
+            total_prompts = fallback[1] or 0
+            total_responses = fallback[2] or 0
+            total_sessions = fallback[3] or 0
+
+        # Tokens and cost by model in one scan (only if usage_records exist),
+        # using the precomputed cost column
         tokens_by_model = {}
-        if total_records > 0:
-            cursor.execute("""
-                SELECT model, SUM(total_tokens) as tokens
-                FROM usage_records
-                GROUP BY model
-                ORDER BY tokens DESC
-            """)
-            tokens_by_model = {row[0]: row[1] for row in cursor.fetchall() if row[0]}
-
-        # Calculate costs using precomputed cost column
-        total_cost = 0.0
         cost_by_model = {}
+        total_cost = 0.0
 
         if total_records > 0:
-            cursor.execute("""
-                SELECT
-                    model,
-                    COALESCE(SUM(cost), 0.0) as model_cost
-                FROM usage_records
-                WHERE model IS NOT NULL
-                GROUP BY model
-            """)
+            try:
+                model_rows = conn.execute(_SQL_MODEL_TOTALS).fetchall()
+            except sqlite3.OperationalError:
+                # model_totals not created yet (database not initialized
+                # by this version)
+                model_rows = conn.execute(_SQL_MODEL_TOTALS_FROM_RECORDS).fetchall()
 
-            for model_row in cursor.fetchall():
-                model = model_row[0]
+            for model, model_tokens, model_cost in model_rows:
                 if not model:
                     continue
-                model_cost = float(model_row[1] or 0.0)
+                tokens_by_model[model] = model_tokens
+                model_cost = float(model_cost or 0.0)
                 cost_by_model[model] = model_cost
                 total_cost += model_cost
 
@@ -3452,7 +4032,7 @@ def get_database_stats(db_path: Path = DEFAULT_DB_PATH) -> dict:
 
         return result
     finally:
-        conn.close()
+        _release_ro_conn(conn)
 
 
 def reset_pricing_to_defaults(db_path: Path = DEFAULT_DB_PATH) -> None:
@@ -3470,7 +4050,7 @@ def reset_pricing_to_defaults(db_path: Path = DEFAULT_DB_PATH) -> None:
     """
     init_database(db_path)
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _open_conn(db_path)
 
     try:
         cursor = conn.cursor()
@@ -3478,22 +4058,16 @@ def reset_pricing_to_defaults(db_path: Path = DEFAULT_DB_PATH) -> None:
 
         timestamp = datetime.now(timezone.utc).isoformat()
 
-        for model_name, pricing_info in DEFAULT_MODEL_PRICING.items():
-            cursor.execute("""
-                INSERT OR REPLACE INTO model_pricing (
-                    model_name, input_price_per_mtok, output_price_per_mtok,
-                    cache_write_price_per_mtok, cache_read_price_per_mtok,
-                    last_updated, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                model_name,
-                pricing_info['input_price'],
-                pricing_info['output_price'],
-                pricing_info['cache_write_price'],
-                pricing_info['cache_read_price'],
-                timestamp,
-                pricing_info.get('notes', '')
-            ))
+        cursor.executemany("""
+            INSERT OR REPLACE INTO model_pricing (
+                model_name, input_price_per_mtok, output_price_per_mtok,
+                cache_write_price_per_mtok, cache_read_price_per_mtok,
+                last_updated, notes
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, _default_pricing_rows(DEFAULT_MODEL_PRICING, timestamp))
+
+        # Keep stored per-row costs in line with the new prices
+        cursor.execute(_SQL_RECOMPUTE_COST + " WHERE model IS NOT NULL")
 
         conn.commit()
     finally:
@@ -3538,7 +4112,7 @@ def update_model_pricing_group(
 
     init_database(db_path)
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _open_conn(db_path)
 
     try:
         cursor = conn.cursor()
@@ -3560,6 +4134,13 @@ def update_model_pricing_group(
                 WHERE model_name = ?
             """, (input_price, output_price, cache_write_price, cache_read_price, timestamp, model_id))
 
+        # Keep stored per-row costs in line with the new prices
+        placeholders = ",".join("?" * len(group['model_ids']))
+        cursor.execute(
+            _SQL_RECOMPUTE_COST + f" WHERE model IN ({placeholders})",
+            tuple(group['model_ids']),
+        )
+
         conn.commit()
     finally:
         conn.close()
@@ -3599,7 +4180,7 @@ def get_model_pricing_for_settings(db_path: Path = DEFAULT_DB_PATH) -> dict:
             "opus-4": {"display_name": "Opus 4", "input_price": 15.0, "output_price": 75.0},
         }
 
-    conn = sqlite3.connect(db_path, timeout=30.0)
+    conn = _get_ro_conn(db_path)
 
     try:
         cursor = conn.cursor()
@@ -3632,7 +4213,7 @@ def get_model_pricing_for_settings(db_path: Path = DEFAULT_DB_PATH) -> dict:
 
         return result
     finally:
-        conn.close()
+        _release_ro_conn(conn)
 
 
 def get_device_hourly_distribution(machine_name: str, db_path: Path = DEFAULT_DB_PATH, week_offset: int = 0, period: str = "weekly") -> dict[tuple[int, int], int]:
@@ -3677,7 +4258,7 @@ def get_device_hourly_distribution(machine_name: str, db_path: Path = DEFAULT_DB
     if machine_db_path is None or not machine_db_path.exists():
         return {}
 
-    conn = sqlite3.connect(machine_db_path)
+    conn = _open_conn(machine_db_path, readonly=True)
     conn.row_factory = sqlite3.Row
 
     try:
@@ -3756,7 +4337,7 @@ def get_device_hourly_distribution(machine_name: str, db_path: Path = DEFAULT_DB
             cursor.execute(query, (week_start, week_end))
 
         result = {}
-        for row in cursor.fetchall():
+        for row in cursor:
             # SQLite's %w: 0=Sunday, 1=Monday, ..., 6=Saturday
             # Convert to Python convention: 0=Monday, ..., 6=Sunday
             sqlite_dow = row['day_of_week']
@@ -3867,7 +4448,7 @@ def check_data_sync_status() -> dict:
         result['source_latest'] = latest_record.timestamp.isoformat()
 
         # Get DB stats
-        conn = sqlite3.connect(DEFAULT_DB_PATH)
+        conn = _open_conn(DEFAULT_DB_PATH, readonly=True)
         cursor = conn.cursor()
 
         # Get latest timestamp from DB
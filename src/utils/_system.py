@@ -1,4 +1,5 @@
 #region Imports
+import os
 import platform
 import subprocess
 from pathlib import Path
@@ -8,6 +9,24 @@ from src.utils.security import validate_sound_name
 #endregion
 
 
+#region Constants
+
+# Host OS, looked up once (platform.system() goes through uname())
+_SYSTEM = platform.system()
+
+# Sound command for this OS, filled in with the validated sound name.
+# Safe: sound_name is validated to contain only safe characters.
+if _SYSTEM == "Darwin":  # macOS
+    _SOUND_CMD_TEMPLATE = "afplay /System/Library/Sounds/{name}.aiff &"
+elif _SYSTEM == "Windows":
+    _SOUND_CMD_TEMPLATE = 'powershell -c "(New-Object Media.SoundPlayer \'C:\\Windows\\Media\\{name}.wav\').PlaySync();" &'
+else:  # Linux
+    # Try to use paplay (PulseAudio) or aplay (ALSA)
+    _SOUND_CMD_TEMPLATE = "(paplay /usr/share/sounds/freedesktop/stereo/{name}.oga 2>/dev/null || aplay /usr/share/sounds/alsa/{name}.wav 2>/dev/null) &"
+
+#endregion
+
+
 #region Functions
 
 
@@ -18,14 +37,18 @@ def open_file(file_path: Path) -> None:
     Args:
         file_path: Path to the file to open
     """
-    system = platform.system()
+    system = _SYSTEM
     try:
         if system == "Darwin":  # macOS
             subprocess.run(["open", str(file_path)], check=False)
         elif system == "Windows":
-            # Use cmd with explicit start command (no shell=True)
-            # Empty string after /c is required for proper file path handling
-            subprocess.run(["cmd", "/c", "start", "", str(file_path)], check=False)
+            # ShellExecute directly, without spawning cmd.exe
+            try:
+                os.startfile(str(file_path))
+            except OSError:
+                # Use cmd with explicit start command (no shell=True)
+                # Empty string after /c is required for proper file path handling
+                subprocess.run(["cmd", "/c", "start", "", str(file_path)], check=False)
         else:  # Linux and others
             subprocess.run(["xdg-open", str(file_path)], check=False)
     except Exception:
@@ -49,18 +72,7 @@ def get_sound_command(sound_name: str) -> Optional[str]:
     if not validate_sound_name(sound_name):
         return None
     
-    system = platform.system()
- 
-    if system == "Darwin":  # macOS
-        # Safe: sound_name is validated to contain only safe characters
-        return f"afplay /System/Library/Sounds/{sound_name}.aiff &"
-    elif system == "Windows":
-        # Safe: sound_name is validated to contain only safe characters
-        return f'powershell -c "(New-Object Media.SoundPlayer \'C:\\Windows\\Media\\{sound_name}.wav\').PlaySync();" &'
-    else:  # Linux
-        # Safe: sound_name is validated to contain only safe characters
-        # Try to use paplay (PulseAudio) or aplay (ALSA)
-        return f"(paplay /usr/share/sounds/freedesktop/stereo/{sound_name}.oga 2>/dev/null || aplay /usr/share/sounds/alsa/{sound_name}.wav 2>/dev/null) &"
+    return _SOUND_CMD_TEMPLATE.format(name=sound_name)
 
 
 #endregion
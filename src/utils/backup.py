@@ -2,13 +2,39 @@
 Automatic backup system for usage database.
 
 Provides automatic daily backups with configurable retention policies.
-Monthly backups (1st of each month) can be preserved permanently.
+Backups from the retention period are kept, plus the newest backup of each
+recent ISO week and the monthly backups (permanently, unless the user
+chooses how many months to keep).
 """
 #region Imports
+import os
 import shutil
-from datetime import datetime, timedelta
+import sqlite3
+from datetime import date, datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+from src.config.user_config import (
+    get_backup_enabled,
+    get_backup_keep_monthly,
+    get_backup_keep_monthly_count,
+    get_backup_keep_weekly,
+    get_backup_keep_yearly,
+    get_backup_retention_days,
+    get_last_backup_date,
+    set_last_backup_date,
+)
+from src.storage.snapshot_db import DEFAULT_DB_PATH
+#endregion
+
+
+#region Constants
+
+# Date (YYYY-MM-DD) on which auto_backup() last found today's backup already
+# done; later calls that day return without re-reading the config
+_checked_date: Optional[str] = None
+
 #endregion
 
 
@@ -25,15 +51,13 @@ def auto_backup() -> bool:
     Returns:
         True if backup was performed, False if skipped or failed
     """
-    try:
-        from src.config.user_config import (
-            get_backup_enabled,
-            get_backup_keep_monthly,
-            get_backup_retention_days,
-            set_last_backup_date,
-        )
-        from src.storage.snapshot_db import DEFAULT_DB_PATH
+    global _checked_date
+
+    today = date.today().isoformat()
+    if _checked_date == today:
+        return False
 
+    try:
         # Check if backups are enabled
         if not get_backup_enabled():
             return False
@@ -44,6 +68,7 @@ def auto_backup() -> bool:
 
         # Check if backup is needed today
         if not should_backup_today():
+            _checked_date = today
             return False
 
         # Create backup
@@ -52,13 +77,17 @@ def auto_backup() -> bool:
             return False
 
         # Update last backup date
-        today = datetime.now().strftime("%Y-%m-%d")
         set_last_backup_date(today)
 
         # Cleanup old backups
-        retention_days = get_backup_retention_days()
-        keep_monthly = get_backup_keep_monthly()
-        cleanup_old_backups(DEFAULT_DB_PATH, retention_days, keep_monthly)
+        cleanup_old_backups_tiered(
+            DEFAULT_DB_PATH,
+            retention_days=get_backup_retention_days(),
+            weekly=get_backup_keep_weekly(),
+            keep_monthly=get_backup_keep_monthly(),
+            monthly=get_backup_keep_monthly_count(),
+            yearly=get_backup_keep_yearly(),
+        )
 
         return True
 
@@ -78,18 +107,19 @@ def should_backup_today() -> bool:
     Returns:
         True if backup is needed, False otherwise
     """
-    from src.config.user_config import get_last_backup_date
-
     last_backup = get_last_backup_date()
 
     # Never backed up before
     if last_backup is None:
         return True
 
-    # Compare with today
+    # Compare with today (stored as YYYY-MM-DD, so usually a plain string match)
+    today = date.today()
+    if last_backup == today.isoformat():
+        return False
+
     try:
         last_date = datetime.strptime(last_backup, "%Y-%m-%d").date()
-        today = datetime.now().date()
         return last_date < today
     except (ValueError, TypeError):
         # Invalid date format, perform backup
@@ -121,8 +151,8 @@ def create_backup(db_path: Path) -> Optional[Path]:
         backups_dir.mkdir(parents=True, exist_ok=True)
 
         # Generate backup filename
-        today = datetime.now()
-        date_str = today.strftime("%Y%m%d")
+        today = date.today()
+        date_str = f"{today.year}{today.month:02d}{today.day:02d}"
 
         # Add "_monthly" suffix for 1st of the month
         if today.day == 1:
@@ -132,8 +162,12 @@ def create_backup(db_path: Path) -> Optional[Path]:
 
         backup_path = backups_dir / backup_filename
 
-        # Copy database file
-        shutil.copy2(db_path, backup_path)
+        # Copy through SQLite's backup API so a write in progress can't leave
+        # a torn copy; fall back to a plain file copy if that fails
+        try:
+            _sqlite_backup(db_path, backup_path)
+        except sqlite3.Error:
+            shutil.copy2(db_path, backup_path)
 
         return backup_path
 
@@ -141,6 +175,76 @@ def create_backup(db_path: Path) -> Optional[Path]:
         return None
 
 
+def _iter_backup_entries(backups_dir: Path) -> Iterator[os.DirEntry]:
+    """
+    Yield the backup files in a backups directory.
+
+    One scandir() pass; DirEntry carries the name without building a Path
+    per file, and on Windows the stat result too.
+
+    Args:
+        backups_dir: Directory holding usage_history_backup_*.db files
+
+    Yields:
+        Directory entries whose names match usage_history_backup_*.db
+    """
+    with os.scandir(backups_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("usage_history_backup_") and name.endswith(".db"):
+                yield entry
+
+
+def _backup_date_str(filename: str) -> Optional[str]:
+    """
+    Extract the YYYYMMDD date from a backup filename.
+
+    Format: usage_history_backup_YYYYMMDD.db or
+    usage_history_backup_YYYYMMDD_monthly.db
+
+    Args:
+        filename: Backup file name (ending in .db)
+
+    Returns:
+        The 8-digit date string, or None if the name doesn't carry one
+    """
+    filename_parts = filename[:-3].split("_", 4)
+    if len(filename_parts) < 4:
+        return None
+
+    date_str = filename_parts[3]  # YYYYMMDD
+    if len(date_str) != 8 or not date_str.isdigit():
+        return None
+    return date_str
+
+
+def _sqlite_backup(db_path: Path, backup_path: Path) -> None:
+    """
+    Copy a database with sqlite3.Connection.backup().
+
+    The source is opened read-only and copied page by page under a read
+    lock, so the backup is a consistent snapshot even while another
+    connection is writing.
+
+    Args:
+        db_path: Path to the database file
+        backup_path: Path to write the backup to (overwritten if present)
+
+    Raises:
+        sqlite3.Error: If either database can't be opened or copied
+    """
+    uri = f"{db_path.resolve().as_uri()}?mode=ro"
+    src = sqlite3.connect(uri, uri=True, timeout=30.0)
+    try:
+        dst = sqlite3.connect(backup_path)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+
 def cleanup_old_backups(
     db_path: Path,
     retention_days: int,
@@ -166,33 +270,125 @@ def cleanup_old_backups(
         if not backups_dir.exists():
             return 0
 
-        # Calculate cutoff date
+        # Calculate cutoff date. Filenames carry YYYYMMDD, which sorts like
+        # the date itself, so compare strings instead of parsing each name.
+        # A backup dated D (midnight) is older than the cutoff moment on day C
+        # whenever D <= C.
         cutoff_date = datetime.now() - timedelta(days=retention_days)
+        cutoff_str = cutoff_date.strftime("%Y%m%d")
 
         deleted_count = 0
 
         # Iterate through all backup files
-        for backup_file in backups_dir.glob("usage_history_backup_*.db"):
+        for entry in _iter_backup_entries(backups_dir):
             # Skip monthly backups if configured
-            if keep_monthly and "_monthly" in backup_file.name:
+            if keep_monthly and "_monthly" in entry.name:
                 continue
 
             # Extract date from filename
-            try:
-                # Format: usage_history_backup_YYYYMMDD.db or usage_history_backup_YYYYMMDD_monthly.db
-                filename_parts = backup_file.stem.split("_")
-                date_str = filename_parts[3]  # YYYYMMDD
-
-                # Parse date
-                backup_date = datetime.strptime(date_str, "%Y%m%d")
+            date_str = _backup_date_str(entry.name)
+            if date_str is None:
+                # Invalid filename format, skip
+                continue
 
-                # Delete if older than retention period
-                if backup_date < cutoff_date:
-                    backup_file.unlink()
+            # Delete if older than retention period
+            if date_str <= cutoff_str:
+                try:
+                    os.unlink(entry.path)
                     deleted_count += 1
+                except OSError:
+                    # Locked or already gone; keep pruning the rest
+                    continue
 
-            except (ValueError, IndexError):
-                # Invalid filename format, skip
+        return deleted_count
+
+    except Exception:
+        return 0
+
+
+def cleanup_old_backups_tiered(
+    db_path: Path,
+    retention_days: int,
+    weekly: int = 0,
+    keep_monthly: bool = True,
+    monthly: Optional[int] = None,
+    yearly: int = 0
+) -> int:
+    """
+    Delete backups outside a grandfather-father-son retention policy.
+
+    Extends cleanup_old_backups() with calendar tiers. A backup is kept if
+    any tier keeps it; every other backup is deleted:
+    - daily: every backup from the last retention_days days
+    - weekly: the newest backup of each of the last N ISO weeks
+    - monthly: "_monthly" backups (1st of each month), all of them unless
+      a month count is given
+    - yearly: with a month count, the newest "_monthly" backup of each of
+      the last N years
+
+    Args:
+        db_path: Path to the database file (used to find backups directory)
+        retention_days: Number of days to keep every backup
+        weekly: Number of recent ISO weeks to keep one backup for
+        keep_monthly: Keep "_monthly" backups beyond the retention period
+        monthly: Number of recent months to keep monthly backups for
+            (None keeps them permanently)
+        yearly: Number of recent years to keep one monthly backup for
+            (only used when monthly is set)
+
+    Returns:
+        Number of backup files deleted
+    """
+    try:
+        # Newest first, files with unparsable names already skipped
+        backups = list_backups(db_path)
+
+        today = date.today()
+        daily_cutoff = today - timedelta(days=retention_days)
+        this_week = today - timedelta(days=today.weekday())  # Monday
+        weekly_cutoff = this_week - timedelta(weeks=weekly)
+        this_month = today.year * 12 + today.month - 1
+
+        keep = set()
+        kept_weeks = set()
+        seen_years = set()
+        for backup in backups:
+            backup_date = backup["date"].date()
+
+            # Same cutoff as cleanup_old_backups()
+            if backup_date > daily_cutoff:
+                keep.add(backup["path"])
+
+            week = backup_date - timedelta(days=backup_date.weekday())
+            if week > weekly_cutoff and week not in kept_weeks:
+                kept_weeks.add(week)
+                keep.add(backup["path"])
+
+            if not (keep_monthly and backup["is_monthly"]):
+                continue
+            if monthly is None:
+                keep.add(backup["path"])
+                continue
+
+            months_ago = this_month - (backup_date.year * 12 + backup_date.month - 1)
+            if months_ago < monthly:
+                keep.add(backup["path"])
+
+            # Newest first, so the first monthly backup seen for a year is its newest
+            if backup_date.year not in seen_years:
+                seen_years.add(backup_date.year)
+                if today.year - backup_date.year < yearly:
+                    keep.add(backup["path"])
+
+        deleted_count = 0
+        for backup in backups:
+            if backup["path"] in keep:
+                continue
+            try:
+                os.unlink(backup["path"])
+                deleted_count += 1
+            except OSError:
+                # Locked or already gone; keep pruning the rest
                 continue
 
         return deleted_count
@@ -223,32 +419,35 @@ def list_backups(db_path: Path) -> list[dict]:
 
         backups = []
 
-        for backup_file in sorted(backups_dir.glob("usage_history_backup_*.db")):
-            try:
-                # Extract date from filename
-                filename_parts = backup_file.stem.split("_")
-                date_str = filename_parts[3]  # YYYYMMDD
-                backup_date = datetime.strptime(date_str, "%Y%m%d")
+        # Names embed YYYYMMDD right after a fixed prefix, so name order
+        # is date order: newest first
+        entries = sorted(_iter_backup_entries(backups_dir), key=attrgetter("name"), reverse=True)
 
-                # Check if monthly
-                is_monthly = "_monthly" in backup_file.name
+        for entry in entries:
+            # Extract date from filename
+            date_str = _backup_date_str(entry.name)
+            if date_str is None:
+                # Invalid filename format, skip
+                continue
 
-                # Get file size
-                size = backup_file.stat().st_size
+            try:
+                backup_date = datetime.strptime(date_str, "%Y%m%d")
+            except ValueError:
+                # Not a real calendar date, skip
+                continue
 
-                backups.append({
-                    "path": backup_file,
-                    "date": backup_date,
-                    "is_monthly": is_monthly,
-                    "size": size,
-                })
+            # Check if monthly
+            is_monthly = "_monthly" in entry.name
 
-            except (ValueError, IndexError):
-                # Invalid filename format, skip
-                continue
+            # Get file size
+            size = entry.stat().st_size
 
-        # Sort by date (newest first)
-        backups.sort(key=lambda x: x["date"], reverse=True)
+            backups.append({
+                "path": Path(entry.path),
+                "date": backup_date,
+                "is_monthly": is_monthly,
+                "size": size,
+            })
 
         return backups
 
@@ -1,4 +1,5 @@
 #region Imports
+import threading
 import time
 from pathlib import Path
 from typing import Callable, Optional
@@ -8,6 +9,17 @@ from watchdog.events import FileSystemEventHandler, FileModifiedEvent, FileCreat
 #endregion
 
 
+#region Constants
+
+# Only changes to files with this suffix are reported
+_JSONL_SUFFIX = ".jsonl"
+
+# Event types JSONLFileHandler acts on
+_WATCHED_EVENTS = [FileModifiedEvent, FileCreatedEvent]
+
+#endregion
+
+
 #region Classes
 
 class JSONLFileHandler(FileSystemEventHandler):
@@ -16,12 +28,15 @@ class JSONLFileHandler(FileSystemEventHandler):
 
     Monitors Claude Code project directories for changes to .jsonl files
     and sets a flag when changes are detected (instead of triggering immediate callback).
+
+    The flag is a threading.Event: it is set from the watchdog observer
+    thread and checked/cleared from the UI thread.
     """
 
     def __init__(self):
         """Initialize the JSONL file handler."""
         super().__init__()
-        self.has_changes = False
+        self._changed = threading.Event()
         self.last_change_time = 0.0
 
     def on_modified(self, event: FileModifiedEvent) -> None:
@@ -31,12 +46,7 @@ class JSONLFileHandler(FileSystemEventHandler):
         Args:
             event: File modification event
         """
-        if event.is_directory:
-            return
-
-        if event.src_path.endswith('.jsonl'):
-            self.has_changes = True
-            self.last_change_time = time.time()
+        self._record_change(event)
 
     def on_created(self, event: FileCreatedEvent) -> None:
         """
@@ -45,12 +55,24 @@ class JSONLFileHandler(FileSystemEventHandler):
         Args:
             event: File creation event
         """
-        if event.is_directory:
+        self._record_change(event)
+
+    def _record_change(self, event) -> None:
+        """
+        Set the change flag if the event concerns a JSONL file.
+
+        Args:
+            event: File system event from the observer thread
+        """
+        if event.is_directory or not event.src_path.endswith(_JSONL_SUFFIX):
             return
 
-        if event.src_path.endswith('.jsonl'):
-            self.has_changes = True
-            self.last_change_time = time.time()
+        self.last_change_time = time.time()
+
+        # Event.set() takes the event's lock and notifies waiters; the rest
+        # of a burst only needs the lock-free is_set() read.
+        if not self._changed.is_set():
+            self._changed.set()
 
     def get_and_reset_changes(self) -> bool:
         """
@@ -59,8 +81,8 @@ class JSONLFileHandler(FileSystemEventHandler):
         Returns:
             True if changes were detected since last check, False otherwise
         """
-        if self.has_changes:
-            self.has_changes = False
+        if self._changed.is_set():
+            self._changed.clear()
             return True
         return False
 
@@ -97,8 +119,19 @@ class FileWatcher:
         self.event_handler = JSONLFileHandler()
         self.observer = Observer()
 
-        # Watch recursively (includes subdirectories)
-        self.observer.schedule(self.event_handler, str(self.watch_path), recursive=True)
+        # Watch recursively (includes subdirectories). Only subscribe to the
+        # events the handler acts on: on Linux the filter narrows the inotify
+        # mask, so our own reads of the JSONL files (open/close events) never
+        # reach the observer thread at all. event_filter needs watchdog 4+.
+        try:
+            self.observer.schedule(
+                self.event_handler,
+                str(self.watch_path),
+                recursive=True,
+                event_filter=_WATCHED_EVENTS,
+            )
+        except TypeError:
+            self.observer.schedule(self.event_handler, str(self.watch_path), recursive=True)
         self.observer.start()
 
     def stop(self) -> None:
@@ -1,6 +1,8 @@
 #region Imports
 import os
 import re
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 #endregion
@@ -26,12 +28,48 @@ FORBIDDEN_WRITE_DIRS = [
     Path("C:\\Program Files (x86)"),
     Path("C:\\ProgramData"),
 ]
+
+# Allow only alphanumeric, hyphens, and underscores, at most 64 characters.
+# \Z rather than $ so a trailing newline does not slip through.
+_SOUND_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]{1,64}\Z')
+
+# Characters replaced when building filenames
+_UNSAFE_CHAR_RE = re.compile(r'[^\w\-]')
 #endregion
 
 
 #region Functions
 
 
+def _forbidden_prefixes() -> tuple[tuple[str, Path], ...]:
+    """
+    Build (prefix, directory) pairs for FORBIDDEN_WRITE_DIRS on this OS.
+
+    Entries for the other OS can never contain a resolved path here, so
+    they are dropped. Each directory is listed as written and, if
+    different, as resolved (e.g. /etc -> /private/etc on macOS). Prefixes
+    are normcased and end with a separator, so string prefix checks match
+    what Path.relative_to() matched.
+
+    Returns:
+        Tuple of (normcased prefix ending in os.sep, forbidden directory)
+    """
+    dirs = [forbidden for forbidden in FORBIDDEN_WRITE_DIRS if forbidden.is_absolute()]
+
+    # Entries as written first, so error messages name the directory hit
+    prefixes = {}
+    for candidate, forbidden in chain(
+        ((forbidden, forbidden) for forbidden in dirs),
+        ((forbidden.resolve(), forbidden) for forbidden in dirs),
+    ):
+        key = os.path.normcase(str(candidate)).rstrip(os.sep) + os.sep
+        prefixes.setdefault(key, forbidden)
+    return tuple(prefixes.items())
+
+
+_FORBIDDEN_PREFIXES = _forbidden_prefixes()
+
+
 def validate_sound_name(sound_name: str) -> bool:
     """
     Validate that a sound name is safe for use in system commands.
@@ -60,10 +98,7 @@ def validate_sound_name(sound_name: str) -> bool:
     if not sound_name:
         return False
     
-    # Allow only alphanumeric, hyphens, and underscores
-    # Maximum length of 64 characters
-    pattern = r'^[a-zA-Z0-9_-]{1,64}$'
-    return bool(re.match(pattern, sound_name))
+    return _SOUND_NAME_RE.match(sound_name) is not None
 
 
 def validate_output_path(path: Path) -> tuple[bool, Optional[str]]:
@@ -92,14 +127,11 @@ def validate_output_path(path: Path) -> tuple[bool, Optional[str]]:
         abs_path = path.resolve()
         
         # Check if trying to write to forbidden directories
-        for forbidden in FORBIDDEN_WRITE_DIRS:
-            try:
-                # Check if abs_path is within or is the forbidden directory
-                abs_path.relative_to(forbidden)
+        # (abs_path is within or is the forbidden directory)
+        abs_str = os.path.normcase(str(abs_path)) + os.sep
+        for prefix, forbidden in _FORBIDDEN_PREFIXES:
+            if abs_str.startswith(prefix):
                 return False, f"Cannot write to system directory: {forbidden}"
-            except ValueError:
-                # Not in this forbidden directory, continue checking
-                continue
         
         # Check if parent directory exists or can be created
         parent = abs_path.parent
@@ -125,6 +157,20 @@ def validate_output_path(path: Path) -> tuple[bool, Optional[str]]:
         return False, f"Invalid path: {e}"
 
 
+@lru_cache(maxsize=16)
+def _resolved_dir(path: str) -> str:
+    """
+    Resolve a base directory to its real absolute path (cached).
+
+    Args:
+        path: Directory path
+
+    Returns:
+        Absolute path with symlinks resolved
+    """
+    return os.path.realpath(path)
+
+
 def validate_file_path(path: Path, base_dir: Path) -> tuple[bool, Optional[str]]:
     """
     Validate that a file path is within the expected base directory.
@@ -146,22 +192,22 @@ def validate_file_path(path: Path, base_dir: Path) -> tuple[bool, Optional[str]]
         (False, "Path is outside base directory")
     """
     try:
-        # Resolve both paths to absolute
-        abs_path = path.resolve()
-        abs_base = base_dir.resolve()
-        
         # Check if it's a symlink
         if path.is_symlink():
             return False, "Cannot follow symbolic links"
         
+        # Resolve both paths to absolute (the base is resolved once per
+        # process, it is the same directory for every file in a scan)
+        abs_path = os.path.normcase(os.path.realpath(path))
+        abs_base = _resolved_dir(str(base_dir))
+        base_key = os.path.normcase(abs_base).rstrip(os.sep)
+        
         # Check if resolved path is within base directory
-        try:
-            abs_path.relative_to(abs_base)
+        if abs_path == base_key or abs_path.startswith(base_key + os.sep):
             return True, None
-        except ValueError:
-            return False, f"Path is outside base directory: {abs_base}"
+        return False, f"Path is outside base directory: {abs_base}"
             
-    except (OSError, RuntimeError) as e:
+    except (OSError, RuntimeError, ValueError) as e:
         return False, f"Invalid path: {e}"
 
 
@@ -231,7 +277,7 @@ def generate_safe_filename(base_name: str, extension: str, include_pid: bool = F
     from datetime import datetime
     
     # Sanitize base name (remove unsafe characters)
-    safe_base = re.sub(r'[^\w\-]', '_', base_name)
+    safe_base = _UNSAFE_CHAR_RE.sub('_', base_name)
     
     # Generate timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -0,0 +1,263 @@
+"""
+Text analysis helpers for message content statistics.
+
+Counts swearing, politeness and the assistant's favourite catchphrases in
+user prompts and assistant responses. All matching is case-insensitive.
+"""
+#region Imports
+import re
+from functools import lru_cache
+from typing import Optional
+#endregion
+
+
+#region Constants
+
+# Swear words (with common stretched spellings, e.g. "fuuuck")
+SWEAR_PATTERNS = [
+    r"\bf+u+c+k+(?:ing|ed|er|s)?\b",
+    r"\bs+h+i+t+(?:ty|s)?\b",
+    r"\bdamn(?:it|ed)?\b",
+    r"\bgoddamn\b",
+    r"\bbitch(?:es|ing)?\b",
+    r"\bass(?:hole|holes)?\b",
+    r"\barse(?:hole)?\b",
+    r"\bhell\b",
+    r"\bpiss(?:ed)?\b",
+    r"\bcock\b",
+    r"\bdick(?:head)?\b",
+    r"\btwat\b",
+    r"\bcrap(?:py)?\b",
+    r"\bwtf\b",
+    r"\bffs\b",
+]
+
+# Assistant enthusiasm ("Perfect!", "Excellent!")
+PERFECT_PATTERNS = [
+    r"\bperfect!",
+    r"\bexcellent!",
+]
+
+# Assistant agreement ("You're absolutely right")
+ABSOLUTELY_RIGHT_PATTERNS = [
+    r"\byou'?re absolutely right\b",
+    r"\byou are absolutely right\b",
+]
+
+# User gratitude
+THANK_PATTERNS = [
+    r"\bthank you\b",
+    r"\bthanks\b",
+    r"\bthx\b",
+    r"\bty\b",
+]
+
+# User politeness
+PLEASE_PATTERNS = [
+    r"\bplease\b",
+    r"\bpls\b",
+    r"\bplz\b",
+]
+
+# Category name -> patterns, in the order returned by count_all()
+CATEGORY_PATTERNS = {
+    "swears": SWEAR_PATTERNS,
+    "perfect": PERFECT_PATTERNS,
+    "absolutely_right": ABSOLUTELY_RIGHT_PATTERNS,
+    "thanks": THANK_PATTERNS,
+    "please": PLEASE_PATTERNS,
+}
+
+# Categories reported per message role
+USER_CATEGORIES = ("swears", "thanks", "please")
+ASSISTANT_CATEGORIES = ("swears", "perfect", "absolutely_right")
+
+# Substrings at least one of which appears in every match of a category
+# (e.g. f+u+c+k+ always contains "fu"). A message containing none of them
+# can't match, so the regex scan is skipped with plain substring checks.
+_CATEGORY_ANCHORS = {
+    "swears": (
+        "fu", "sh", "damn", "bitch", "ass", "arse", "hell", "piss",
+        "cock", "dick", "twat", "crap", "wtf", "ffs",
+    ),
+    "perfect": ("perfect!", "excellent!"),
+    "absolutely_right": ("absolutely right",),
+    "thanks": ("thank", "thx", "ty"),
+    "please": ("please", "pls", "plz"),
+}
+
+
+def _alternation(patterns: list[str]) -> str:
+    """Join patterns into one non-capturing alternation."""
+    return "|".join(f"(?:{p})" for p in patterns)
+
+
+# One compiled alternation per category for the count_* helpers, so each
+# scans the text once. No two patterns in a category match the same span,
+# so this counts exactly what one findall() per pattern counted.
+_SWEAR_RE = re.compile(_alternation(SWEAR_PATTERNS))
+_PERFECT_RE = re.compile(_alternation(PERFECT_PATTERNS))
+_ABSOLUTELY_RIGHT_RE = re.compile(_alternation(ABSOLUTELY_RIGHT_PATTERNS))
+_THANK_RE = re.compile(_alternation(THANK_PATTERNS))
+_PLEASE_RE = re.compile(_alternation(PLEASE_PATTERNS))
+
+#endregion
+
+
+#region Functions
+
+
+def _may_match(category: str, text_lower: str) -> bool:
+    """Check whether lowered text contains any anchor of a category."""
+    return any(anchor in text_lower for anchor in _CATEGORY_ANCHORS[category])
+
+
+@lru_cache(maxsize=32)
+def _compile_categories(categories: tuple[str, ...]) -> re.Pattern:
+    """
+    Compile one alternation over the given categories' patterns.
+
+    Each category becomes a named group. No two patterns can match the same
+    span, so a single finditer() pass finds exactly what the per-pattern
+    loops find.
+
+    Args:
+        categories: Category names (keys of CATEGORY_PATTERNS)
+
+    Returns:
+        Compiled pattern whose match.lastgroup is the category name
+    """
+    return re.compile(
+        "|".join(
+            f"(?P<{name}>{_alternation(CATEGORY_PATTERNS[name])})"
+            for name in categories
+        )
+    )
+
+
+def count_all(text: str, categories: Optional[tuple[str, ...]] = None) -> dict[str, int]:
+    """
+    Count every category in a single pass over the text.
+
+    Args:
+        text: Message content
+        categories: Only count these categories (e.g. USER_CATEGORIES);
+            defaults to all of CATEGORY_PATTERNS
+
+    Returns:
+        Dictionary mapping category name to count
+    """
+    if categories is None:
+        categories = tuple(CATEGORY_PATTERNS)
+
+    counts = dict.fromkeys(categories, 0)
+    if not text:
+        return counts
+
+    # Only scan for categories whose anchors occur in the text
+    text_lower = text.lower()
+    present = tuple(name for name in categories if _may_match(name, text_lower))
+    if not present:
+        return counts
+
+    for match in _compile_categories(present).finditer(text_lower):
+        counts[match.lastgroup] += 1
+    return counts
+
+
+def count_swears(text: str) -> int:
+    """
+    Count swear words in text.
+
+    Args:
+        text: Message content
+
+    Returns:
+        Number of swear word occurrences
+    """
+    if not text:
+        return 0
+
+    text_lower = text.lower()
+    if not _may_match("swears", text_lower):
+        return 0
+    return len(_SWEAR_RE.findall(text_lower))
+
+
+def count_perfect_phrases(text: str) -> int:
+    """
+    Count "Perfect!" / "Excellent!" exclamations in text.
+
+    Args:
+        text: Message content
+
+    Returns:
+        Number of occurrences
+    """
+    if not text:
+        return 0
+
+    text_lower = text.lower()
+    if not _may_match("perfect", text_lower):
+        return 0
+    return len(_PERFECT_RE.findall(text_lower))
+
+
+def count_absolutely_right_phrases(text: str) -> int:
+    """
+    Count "You're absolutely right" phrases in text.
+
+    Args:
+        text: Message content
+
+    Returns:
+        Number of occurrences
+    """
+    if not text:
+        return 0
+
+    text_lower = text.lower()
+    if not _may_match("absolutely_right", text_lower):
+        return 0
+    return len(_ABSOLUTELY_RIGHT_RE.findall(text_lower))
+
+
+def count_thank_phrases(text: str) -> int:
+    """
+    Count thank-you phrases in text.
+
+    Args:
+        text: Message content
+
+    Returns:
+        Number of occurrences
+    """
+    if not text:
+        return 0
+
+    text_lower = text.lower()
+    if not _may_match("thanks", text_lower):
+        return 0
+    return len(_THANK_RE.findall(text_lower))
+
+
+def count_please_phrases(text: str) -> int:
+    """
+    Count "please" (and its abbreviations) in text.
+
+    Args:
+        text: Message content
+
+    Returns:
+        Number of occurrences
+    """
+    if not text:
+        return 0
+
+    text_lower = text.lower()
+    if not _may_match("please", text_lower):
+        return 0
+    return len(_PLEASE_RE.findall(text_lower))
+
+
+#endregion
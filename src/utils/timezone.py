@@ -4,11 +4,31 @@ Timezone utilities for converting UTC timestamps to local timezone.
 Supports auto-detection of system timezone and manual timezone selection.
 All data is stored in UTC and converted to local timezone only for display.
 """
+import os
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
-from typing import Optional
+from typing import Iterable, Optional
 
 
+@lru_cache(maxsize=32)
+def _get_zoneinfo(tz_name: str) -> ZoneInfo:
+    """
+    Get the ZoneInfo for a timezone name (cached).
+
+    Args:
+        tz_name: IANA timezone name
+
+    Returns:
+        ZoneInfo instance
+
+    Raises:
+        ZoneInfoNotFoundError, ValueError: If the name is not a valid timezone
+    """
+    return ZoneInfo(tz_name)
+
+
+@lru_cache(maxsize=1)
 def get_system_timezone() -> str:
     """
     Get the system's timezone name.
@@ -19,25 +39,27 @@ def get_system_timezone() -> str:
     def _is_valid_tz(tz_name: str) -> bool:
         """Check if timezone name is valid."""
         try:
-            ZoneInfo(tz_name)
+            _get_zoneinfo(tz_name)
             return True
         except:
             return False
 
     try:
         # Try to get timezone from environment variable first
-        import os
         tz_env = os.environ.get('TZ')
         if tz_env and _is_valid_tz(tz_env):
             return tz_env
 
-        # Try to read from /etc/timezone (Linux)
+        # Try to read from /etc/timezone (Linux); one short unbuffered read
         try:
-            with open('/etc/timezone', 'r') as f:
-                tz_file = f.read().strip()
-                if tz_file and _is_valid_tz(tz_file):
-                    return tz_file
-        except:
+            fd = os.open('/etc/timezone', os.O_RDONLY)
+            try:
+                tz_file = os.read(fd, 256).decode().strip()
+            finally:
+                os.close(fd)
+            if tz_file and _is_valid_tz(tz_file):
+                return tz_file
+        except (OSError, ValueError):
             pass
 
         # Get system timezone from datetime
@@ -56,17 +78,56 @@ def get_system_timezone() -> str:
         return 'UTC'
 
 
+def _preferences_file_key() -> Optional[tuple[int, int]]:
+    """
+    Identify the current contents of the preferences database.
+
+    Any committed write rewrites the DB file (DELETE journal mode), so
+    (mtime, size) changes whenever a preference is saved, by this process
+    or another (e.g. a separate `settings` run).
+
+    Returns:
+        (st_mtime_ns, st_size), or None if the file doesn't exist
+    """
+    from src.storage.snapshot_db import DEFAULT_DB_PATH
+    try:
+        stat = os.stat(DEFAULT_DB_PATH)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1)
+def _load_timezone_preference(file_key: Optional[tuple[int, int]]) -> str:
+    """
+    Read the timezone preference from the database (cached per file_key).
+
+    Errors propagate and are not cached, so a failed read is retried on the
+    next call.
+
+    Args:
+        file_key: _preferences_file_key() of the database being read
+
+    Returns:
+        Stored timezone preference, 'auto' if not set
+    """
+    from src.storage.snapshot_db import load_user_preferences
+    prefs = load_user_preferences()
+    return prefs.get('timezone', 'auto')
+
+
 def get_user_timezone() -> str:
     """
     Get the user's configured timezone from database.
 
+    The preference is re-read only when the database file has changed
+    since the last read.
+
     Returns:
         IANA timezone name or 'auto' for system detection
     """
     try:
-        from src.storage.snapshot_db import load_user_preferences
-        prefs = load_user_preferences()
-        tz_setting = prefs.get('timezone', 'auto')
+        tz_setting = _load_timezone_preference(_preferences_file_key())
 
         # If auto, return system timezone
         if tz_setting == 'auto':
@@ -78,6 +139,18 @@ def get_user_timezone() -> str:
         return get_system_timezone()
 
 
+def clear_timezone_cache() -> None:
+    """
+    Forget cached timezone lookups.
+
+    Called when user preferences are written, so the next
+    get_user_timezone() call sees the new value even if the file's
+    mtime didn't visibly change.
+    """
+    _load_timezone_preference.cache_clear()
+    get_system_timezone.cache_clear()
+
+
 def get_timezone_info(tz_name: str) -> dict:
     """
     Get timezone information including offset.
@@ -92,7 +165,7 @@ def get_timezone_info(tz_name: str) -> dict:
         - abbr: Timezone abbreviation (e.g., 'KST')
     """
     try:
-        tz = ZoneInfo(tz_name)
+        tz = _get_zoneinfo(tz_name)
         now = datetime.now(tz)
 
         # Get UTC offset
@@ -137,11 +210,11 @@ def convert_to_local(utc_datetime: datetime, tz_name: Optional[str] = None) -> d
         if tz_name is None:
             tz_name = get_user_timezone()
 
-        tz = ZoneInfo(tz_name)
+        tz = _get_zoneinfo(tz_name)
 
         # Ensure datetime is timezone-aware (assume UTC if naive)
         if utc_datetime.tzinfo is None:
-            utc_datetime = utc_datetime.replace(tzinfo=ZoneInfo('UTC'))
+            utc_datetime = utc_datetime.replace(tzinfo=_get_zoneinfo('UTC'))
 
         # Convert to local timezone
         return utc_datetime.astimezone(tz)
@@ -170,6 +243,40 @@ def format_local_time(utc_datetime: datetime, format_string: str, tz_name: Optio
         return utc_datetime.strftime(format_string)
 
 
+def format_local_time_batch(
+    utc_datetimes: Iterable[datetime],
+    format_string: str,
+    tz_name: Optional[str] = None
+) -> list[str]:
+    """
+    Convert many UTC datetimes to local timezone and format them.
+
+    Same result as calling format_local_time() per item, but the timezone is
+    resolved once and the loop has no per-item exception handling.
+
+    Args:
+        utc_datetimes: Datetimes in UTC (timezone-aware or naive)
+        format_string: strftime format string (e.g., '%H:00')
+        tz_name: Optional timezone name (uses user preference if not provided)
+
+    Returns:
+        Formatted time strings in local timezone, in input order
+    """
+    try:
+        if tz_name is None:
+            tz_name = get_user_timezone()
+        tz = _get_zoneinfo(tz_name)
+        utc = _get_zoneinfo('UTC')
+    except Exception:
+        # Fallback: format as-is
+        return [dt.strftime(format_string) for dt in utc_datetimes]
+
+    return [
+        (dt if dt.tzinfo is not None else dt.replace(tzinfo=utc)).astimezone(tz).strftime(format_string)
+        for dt in utc_datetimes
+    ]
+
+
 def list_common_timezones() -> list[dict]:
     """
     Get list of commonly used timezones for UI selection.
@@ -210,7 +317,7 @@ def validate_timezone(tz_name: str) -> bool:
         return True
 
     try:
-        ZoneInfo(tz_name)
+        _get_zoneinfo(tz_name)
         return True
     except Exception:
         return False
@@ -515,7 +515,7 @@ def render_dashboard(summary: UsageSummary, stats: AggregatedStats, records: lis
         # Calculate hourly hours for keyboard navigation
         # Filter records to only those from target_date
         from collections import defaultdict
-        from src.utils.timezone import format_local_time, get_user_timezone
+        from src.utils.timezone import format_local_time_batch, get_user_timezone
 
         filtered_records = [
             record for record in records
@@ -526,11 +526,13 @@ def render_dashboard(summary: UsageSummary, stats: AggregatedStats, records: lis
             user_tz = get_user_timezone()
             hourly_data = defaultdict(int)
 
-            for record in filtered_records:
-                if record.token_usage:
-                    # Convert UTC timestamp to local timezone hour
-                    hour = format_local_time(record.timestamp, "%H:00", user_tz)
-                    hourly_data[hour] += record.token_usage.total_tokens
+            # Convert UTC timestamps to local timezone hours in one pass
+            usage_records = [record for record in filtered_records if record.token_usage]
+            hours = format_local_time_batch(
+                (record.timestamp for record in usage_records), "%H:00", user_tz
+            )
+            for record, hour in zip(usage_records, hours):
+                hourly_data[hour] += record.token_usage.total_tokens
 
             # Sort by hour in descending order (same as display order)
             sorted_hours = sorted(hourly_data.keys(), reverse=True)
@@ -2146,28 +2148,30 @@ def _create_daily_detail_view(records: list[UsageRecord], target_date: str) -> G
     })
 
     # Import timezone utilities and get timezone once (performance optimization)
-    from src.utils.timezone import format_local_time, get_user_timezone
+    from src.utils.timezone import format_local_time_batch, get_user_timezone
     user_tz = get_user_timezone()  # Load timezone once instead of per-record
 
-    for record in filtered_records:
-        if record.token_usage:
-            # Convert UTC timestamp to local timezone for display
-            hour = format_local_time(record.timestamp, "%H:00", user_tz)
-            hourly_data[hour]["input_tokens"] += record.token_usage.input_tokens
-            hourly_data[hour]["output_tokens"] += record.token_usage.output_tokens
-            hourly_data[hour]["cache_creation"] += record.token_usage.cache_creation_tokens
-            hourly_data[hour]["cache_read"] += record.token_usage.cache_read_tokens
-            hourly_data[hour]["messages"] += 1
+    # Convert UTC timestamps to local timezone hours in one pass
+    usage_records = [record for record in filtered_records if record.token_usage]
+    hours = format_local_time_batch(
+        (record.timestamp for record in usage_records), "%H:00", user_tz
+    )
+    for record, hour in zip(usage_records, hours):
+        hourly_data[hour]["input_tokens"] += record.token_usage.input_tokens
+        hourly_data[hour]["output_tokens"] += record.token_usage.output_tokens
+        hourly_data[hour]["cache_creation"] += record.token_usage.cache_creation_tokens
+        hourly_data[hour]["cache_read"] += record.token_usage.cache_read_tokens
+        hourly_data[hour]["messages"] += 1
 
-            if record.model and record.model != "<synthetic>":
-                cost = calculate_cost(
-                    record.token_usage.input_tokens,
-                    record.token_usage.output_tokens,
-                    record.model,
-                    record.token_usage.cache_creation_tokens,
-                    record.token_usage.cache_read_tokens,
-                )
-                hourly_data[hour]["cost"] += cost
+        if record.model and record.model != "<synthetic>":
+            cost = calculate_cost(
+                record.token_usage.input_tokens,
+                record.token_usage.output_tokens,
+                record.model,
+                record.token_usage.cache_creation_tokens,
+                record.token_usage.cache_read_tokens,
+            )
+            hourly_data[hour]["cost"] += cost
 
     # Create hourly table
     hourly_table = Table(show_header=True, box=None, padding=(0, 2))
@@ -25,6 +25,9 @@ DEVICE_COLORS = [
     "#ff6b6b",  # Red
     "#4ecdc4",  # Teal
 ]
+
+# Device chart bars, indexed by length (0-30 chars)
+_BARS = tuple("█" * i for i in range(31))
 #endregion
 
 
@@ -112,7 +115,7 @@ def _render_device_chart(devices: list[dict]) -> Panel:
             bar_length = 0
 
         # Create bar with gradient
-        bar = "█" * bar_length
+        bar = _BARS[bar_length]
 
         # Color based on usage
         if tokens == max_tokens: